@@ -130,6 +130,7 @@ from src.orchestration import (
     IterativeRefinementController,
     RefinementConfig,
     RefinementResult,
+    uvloop_loop_factory,
 )
 from src.common.logging import setup_logging, get_logger
 
@@ -898,13 +899,19 @@ Examples:
             print(f"Warning: Playbook not found at {playbook_path}, ignoring")
             playbook_path = None
 
-    success = asyncio.run(run_demo(
+    demo = run_demo(
         with_constraints=args.with_constraints,
         intent=intent,
         scenario=scenario,
         brand=brand,
         playbook_path=playbook_path,
-    ))
+    )
+    loop_factory = uvloop_loop_factory()
+    if loop_factory is None:
+        success = asyncio.run(demo)
+    else:
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            success = runner.run(demo)
     sys.exit(0 if success else 1)
 
 
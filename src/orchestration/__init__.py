@@ -7,6 +7,7 @@ from src.orchestration.refinement import (
     RefinementIteration,
     RefinementStatus,
     default_fix_function,
+    uvloop_loop_factory,
     run_refinement_loop,
 )
 from src.orchestration.feedback_consumer import (
@@ -26,6 +27,7 @@ __all__ = [
     "RefinementIteration",
     "RefinementStatus",
     "default_fix_function",
+    "uvloop_loop_factory",
     "run_refinement_loop",
     # Feedback Consumption
     "FeedbackConsumer",
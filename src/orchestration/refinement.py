@@ -133,6 +133,30 @@ class RefinementResult(BaseModel):
     errors: list[str] = Field(default_factory=list)
 
 
+@dataclass
+class _CostAccumulator:
+    """Running cost totals for a single refinement run."""
+
+    critique: float = 0.0
+    fix: float = 0.0
+
+    @property
+    def total(self) -> float:
+        return self.critique + self.fix
+
+    def add(self, iteration: RefinementIteration) -> None:
+        self.critique += iteration.critique_cost
+        self.fix += iteration.fix_cost
+
+    def exceeds(self, budget: float) -> bool:
+        """Whether the running total has reached budget."""
+        return self.total >= budget
+
+
+class _RefinementCancelled(Exception):
+    """Raised internally when cancel() interrupts the refinement loop."""
+
+
 # Type alias for fix function
 FixFunction = Callable[[SceneGraph, CriticOutput], SceneGraph]
 
@@ -147,6 +171,7 @@ class IterativeRefinementController:
     - Score convergence detection
     - Prioritized fix ordering
     - Full iteration history
+    - Cooperative cancellation via cancel()
     """
 
     def __init__(
@@ -157,6 +182,22 @@ class IterativeRefinementController:
         self.config = config or RefinementConfig()
         self.critic = critic or CriticAgent()
         self._fix_functions: list[FixFunction] = []
+        self._cancel = asyncio.Event()
+
+    def cancel(self) -> None:
+        """
+        Request that refinement stops as soon as possible.
+
+        Checked before each iteration and raced against in-flight critic
+        calls, so the loop aborts without waiting for the iteration to end.
+        The controller stays cancelled once this has been called.
+        """
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancel() has been called."""
+        return self._cancel.is_set()
 
     def register_fix_function(self, fn: FixFunction) -> None:
         """Register a function that applies fixes to a SceneGraph."""
@@ -183,38 +224,39 @@ class IterativeRefinementController:
         )
 
         current_graph = scene_graph
-        total_cost = 0.0
+        costs = _CostAccumulator()
 
         logger.info("refinement_started", story_id=scene_graph.story.id)
 
         try:
             for iteration_num in range(self.config.max_iterations):
-                # Check budget before starting iteration
-                if total_cost >= self.config.max_cost_dollars:
-                    logger.info(
-                        "budget_exceeded",
-                        cost=total_cost,
-                        cap=self.config.max_cost_dollars,
-                    )
+                # Check for cancellation before starting iteration
+                if self._cancel.is_set():
+                    raise _RefinementCancelled()
+
+                # Check budget before starting a paid iteration
+                stop, status, reason = self._check_budget(costs)
+                if stop:
                     result = result.model_copy(update={
-                        "status": RefinementStatus.BUDGET_EXCEEDED,
+                        "status": status,
+                        "stop_reason": reason,
                     })
                     break
 
                 # Run iteration
-                iteration_result, current_graph, iteration_cost = await self._run_iteration(
+                iteration_result, current_graph = await self._run_iteration(
                     iteration_num,
                     current_graph,
                     fix_function,
                 )
 
-                total_cost += iteration_cost
+                costs.add(iteration_result)
                 result = result.model_copy(update={
                     "iterations": list(result.iterations) + [iteration_result],
                     "iterations_completed": iteration_num + 1,
-                    "total_cost": total_cost,
-                    "critique_costs": result.critique_costs + iteration_result.critique_cost,
-                    "fix_costs": result.fix_costs + iteration_result.fix_cost,
+                    "total_cost": costs.total,
+                    "critique_costs": costs.critique,
+                    "fix_costs": costs.fix,
                 })
 
                 # Record initial score on first iteration
@@ -223,10 +265,11 @@ class IterativeRefinementController:
                         "initial_score": iteration_result.input_score,
                     })
 
-                # Check stopping conditions
+                # Check stopping conditions (including the budget cap)
                 stop, status, reason = self._check_stopping_conditions(
                     iteration_result,
                     result,
+                    costs,
                 )
 
                 if stop:
@@ -243,13 +286,19 @@ class IterativeRefinementController:
                     "stop_reason": f"max_iterations_reached: {self.config.max_iterations}",
                 })
 
-        except Exception as e:
-            logger.error("refinement_failed", error=str(e))
+        except _RefinementCancelled:
+            logger.info("refinement_cancelled", iterations=result.iterations_completed)
             result = result.model_copy(update={
-                "status": RefinementStatus.FAILED,
-                "errors": list(result.errors) + [str(e)],
+                "status": RefinementStatus.ABORTED,
+                "stop_reason": "cancelled",
             })
 
+        except Exception as e:
+            logger.error("refinement_failed", error=str(e), exc_info=True)
+            # Mutate in place: the failure path should stay cheap
+            result.status = RefinementStatus.FAILED
+            result.errors.append(str(e))
+
         # Finalize result
         final_iteration = result.iterations[-1] if result.iterations else None
         final_score = final_iteration.output_score if final_iteration else 0.0
@@ -281,7 +330,7 @@ class IterativeRefinementController:
         iteration_num: int,
         scene_graph: SceneGraph,
         fix_function: FixFunction | None,
-    ) -> tuple[RefinementIteration, SceneGraph, float]:
+    ) -> tuple[RefinementIteration, SceneGraph]:
         """Run a single refinement iteration."""
         logger.info("iteration_started", iteration=iteration_num)
 
@@ -289,7 +338,7 @@ class IterativeRefinementController:
         total_cost = 0.0
 
         # Step 1: Run critic
-        critic_result = await self.critic(CriticInput(scene_graph=scene_graph))
+        critic_result = await self._critique(scene_graph)
         critique_cost = self.config.cost_per_critique
         total_cost += critique_cost
 
@@ -351,7 +400,8 @@ class IterativeRefinementController:
 
         # Step 3: Re-evaluate after fixes
         if refined_graph is not scene_graph:
-            post_fix_result = await self.critic(CriticInput(scene_graph=refined_graph))
+            post_fix_result = await self._critique(refined_graph)
+            critique_cost += self.config.cost_per_critique
             total_cost += self.config.cost_per_critique
             output_score = post_fix_result.story_feedback.overall_score
             output_dimensions = post_fix_result.story_feedback.dimension_scores
@@ -365,6 +415,7 @@ class IterativeRefinementController:
             "score_improvement": output_score - input_score,
             "fixes_applied": fixes_applied,
             "fix_descriptions": fix_descriptions,
+            "critique_cost": critique_cost,
             "fix_cost": fix_cost,
             "iteration_cost": total_cost,
         })
@@ -378,7 +429,35 @@ class IterativeRefinementController:
             cost=total_cost,
         )
 
-        return iteration, refined_graph, total_cost
+        return iteration, refined_graph
+
+    async def _critique(self, scene_graph: SceneGraph) -> CriticOutput:
+        """Run the critic, aborting early if cancel() is called meanwhile."""
+        if self._cancel.is_set():
+            raise _RefinementCancelled()
+
+        critic_task = asyncio.ensure_future(
+            self.critic(CriticInput(scene_graph=scene_graph))
+        )
+        cancel_task = asyncio.ensure_future(self._cancel.wait())
+
+        try:
+            done, _ = await asyncio.wait(
+                {critic_task, cancel_task},
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            cancel_task.cancel()
+            if not critic_task.done():
+                # Don't leave the critic running after we stop waiting on it,
+                # whether cancel() won the race or our caller was cancelled
+                critic_task.cancel()
+                await asyncio.gather(critic_task, return_exceptions=True)
+
+        if critic_task not in done:
+            raise _RefinementCancelled()
+
+        return critic_task.result()
 
     def _prioritize_issues(self, issues: list) -> list:
         """Prioritize issues by dimension weight and severity."""
@@ -407,6 +486,7 @@ class IterativeRefinementController:
         self,
         iteration: RefinementIteration,
         result: RefinementResult,
+        costs: _CostAccumulator,
     ) -> tuple[bool, RefinementStatus, str]:
         """Check if refinement should stop. Returns (should_stop, status, reason)."""
 
@@ -445,11 +525,16 @@ class IterativeRefinementController:
             return True, RefinementStatus.CONVERGED, reason
 
         # Condition 5: Budget cap
-        if result.total_cost >= self.config.max_cost_dollars:
-            reason = f"budget_exceeded: ${result.total_cost:.2f} >= ${self.config.max_cost_dollars:.2f}"
-            return True, RefinementStatus.BUDGET_EXCEEDED, reason
+        return self._check_budget(costs)
+
+    def _check_budget(self, costs: _CostAccumulator) -> tuple[bool, RefinementStatus, str]:
+        """Check the budget cap. Returns (should_stop, status, reason)."""
+        if not costs.exceeds(self.config.max_cost_dollars):
+            return False, RefinementStatus.IN_PROGRESS, ""
 
-        return False, RefinementStatus.IN_PROGRESS, ""
+        reason = f"budget_exceeded: ${costs.total:.2f} >= ${self.config.max_cost_dollars:.2f}"
+        logger.info("budget_exceeded", cost=costs.total, cap=self.config.max_cost_dollars)
+        return True, RefinementStatus.BUDGET_EXCEEDED, reason
 
 
 def default_fix_function(
@@ -476,6 +561,30 @@ def default_fix_function(
     return scene_graph
 
 
+def uvloop_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """
+    Event loop factory for asyncio.Runner that creates uvloop loops.
+
+    Refinement runs are dominated by awaits on the critic, so many
+    concurrent pilots benefit from uvloop's cheaper scheduling. The
+    global event loop policy is left untouched.
+    Install with: pip install krag-video-platform[perf]
+
+    Returns:
+        uvloop.new_event_loop, or None if uvloop is unavailable or
+        asyncio.Runner is (Python < 3.11); callers then use asyncio.run().
+    """
+    if not hasattr(asyncio, "Runner"):
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop_unavailable")
+        return None
+
+    return uvloop.new_event_loop
+
+
 async def run_refinement_loop(
     scene_graph: SceneGraph,
     max_iterations: int = 2,  # Tight default
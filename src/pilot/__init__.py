@@ -4,76 +4,102 @@ This module provides infrastructure for running real founder pilots
 safely, predictably, and repeatably.
 """
 
-from src.pilot.run import (
-    PilotRun,
-    PilotRunAttempt,
-    PilotStatus,
-    ApprovalOutcome,
-    FeedbackMode,
-    FeedbackDecision,
-    FEEDBACK_FLAGS,
-    PilotStore,
-    create_pilot,
-)
-from src.pilot.runbook import (
-    PilotRunbookBuilder,
-    RunbookConfig,
-    generate_pilot_runbook,
-)
-from src.pilot.artifacts import (
-    FounderArtifacts,
-    generate_founder_artifacts,
-    generate_founder_instructions,
-    generate_what_to_expect,
-    generate_approval_criteria,
-)
-from src.pilot.outcome import (
-    PilotMetrics,
-    Recommendation,
-    FounderSatisfactionLevel,
-    SystemHealthLevel,
-    FounderSatisfaction,
-    SystemHealth,
-    compute_pilot_metrics,
-    assess_founder_satisfaction,
-    assess_system_health,
-    determine_recommendation,
-    generate_pilot_outcome_report,
-    generate_multi_pilot_report,
-)
+from __future__ import annotations
 
-__all__ = [
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.pilot.run import (
+        PilotRun,
+        PilotRunAttempt,
+        PilotStatus,
+        ApprovalOutcome,
+        FeedbackMode,
+        FeedbackDecision,
+        FEEDBACK_FLAGS,
+        PilotStore,
+        create_pilot,
+    )
+    from src.pilot.runbook import (
+        PilotRunbookBuilder,
+        RunbookConfig,
+        generate_pilot_runbook,
+    )
+    from src.pilot.artifacts import (
+        FounderArtifacts,
+        generate_founder_artifacts,
+        generate_founder_instructions,
+        generate_what_to_expect,
+        generate_approval_criteria,
+    )
+    from src.pilot.outcome import (
+        PilotMetrics,
+        Recommendation,
+        FounderSatisfactionLevel,
+        SystemHealthLevel,
+        FounderSatisfaction,
+        SystemHealth,
+        compute_pilot_metrics,
+        assess_founder_satisfaction,
+        assess_system_health,
+        determine_recommendation,
+        generate_pilot_outcome_report,
+        generate_pilot_outcome_reports,
+        generate_multi_pilot_report,
+    )
+
+# Public name -> defining submodule. Submodules are imported on first
+# attribute access (PEP 562) so lightweight consumers don't pay for all of
+# them up front.
+_LAZY_IMPORTS: dict[str, str] = {
     # Run
-    "PilotRun",
-    "PilotRunAttempt",
-    "PilotStatus",
-    "ApprovalOutcome",
-    "FeedbackMode",
-    "FeedbackDecision",
-    "FEEDBACK_FLAGS",
-    "PilotStore",
-    "create_pilot",
+    "PilotRun": "src.pilot.run",
+    "PilotRunAttempt": "src.pilot.run",
+    "PilotStatus": "src.pilot.run",
+    "ApprovalOutcome": "src.pilot.run",
+    "FeedbackMode": "src.pilot.run",
+    "FeedbackDecision": "src.pilot.run",
+    "FEEDBACK_FLAGS": "src.pilot.run",
+    "PilotStore": "src.pilot.run",
+    "create_pilot": "src.pilot.run",
     # Runbook
-    "PilotRunbookBuilder",
-    "RunbookConfig",
-    "generate_pilot_runbook",
+    "PilotRunbookBuilder": "src.pilot.runbook",
+    "RunbookConfig": "src.pilot.runbook",
+    "generate_pilot_runbook": "src.pilot.runbook",
     # Artifacts
-    "FounderArtifacts",
-    "generate_founder_artifacts",
-    "generate_founder_instructions",
-    "generate_what_to_expect",
-    "generate_approval_criteria",
+    "FounderArtifacts": "src.pilot.artifacts",
+    "generate_founder_artifacts": "src.pilot.artifacts",
+    "generate_founder_instructions": "src.pilot.artifacts",
+    "generate_what_to_expect": "src.pilot.artifacts",
+    "generate_approval_criteria": "src.pilot.artifacts",
     # Outcome
-    "PilotMetrics",
-    "Recommendation",
-    "FounderSatisfactionLevel",
-    "SystemHealthLevel",
-    "FounderSatisfaction",
-    "SystemHealth",
-    "compute_pilot_metrics",
-    "assess_founder_satisfaction",
-    "assess_system_health",
-    "determine_recommendation",
-    "generate_pilot_outcome_report",
-    "generate_multi_pilot_report",
-]
+    "PilotMetrics": "src.pilot.outcome",
+    "Recommendation": "src.pilot.outcome",
+    "FounderSatisfactionLevel": "src.pilot.outcome",
+    "SystemHealthLevel": "src.pilot.outcome",
+    "FounderSatisfaction": "src.pilot.outcome",
+    "SystemHealth": "src.pilot.outcome",
+    "compute_pilot_metrics": "src.pilot.outcome",
+    "assess_founder_satisfaction": "src.pilot.outcome",
+    "assess_system_health": "src.pilot.outcome",
+    "determine_recommendation": "src.pilot.outcome",
+    "generate_pilot_outcome_report": "src.pilot.outcome",
+    "generate_pilot_outcome_reports": "src.pilot.outcome",
+    "generate_multi_pilot_report": "src.pilot.outcome",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -9,11 +9,54 @@ Generates plain-English documents for founders:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from functools import lru_cache
+from importlib import resources
 from pathlib import Path
 
 from src.pilot.run import PilotRun
 
+# Each artifact is a few KiB; one buffer fits the whole file in one write
+_WRITE_BUFFER_SIZE = 1 << 16
+
+
+def _write_text(path: Path, content: str) -> None:
+    """Write an artifact as UTF-8 with a single buffered write."""
+    with path.open("w", encoding="utf-8", newline="\n", buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(content)
+
+
+@lru_cache
+def _template(name: str) -> str:
+    """Load an artifact body from templates/<name>.txt.tmpl (str.format placeholders)."""
+    return (
+        resources.files(__package__)
+        .joinpath("templates", f"{name}.txt.tmpl")
+        .read_text(encoding="utf-8")
+    )
+
+
+def _first_name(pilot: PilotRun) -> str:
+    """First word of the founder's name, used in greetings."""
+    return pilot.founder_name.lstrip().partition(" ")[0]
+
+
+def _maybe_write(output_path: Path | str | None, content: str) -> None:
+    """Write content to output_path, creating its directory, if a path is given."""
+    if not output_path:
+        return
+    if not isinstance(output_path, Path):
+        output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    _write_text(output_path, content)
+
+
+def _render_founder_instructions(pilot: PilotRun) -> str:
+    """Render the body of founder_instructions.txt."""
+    return _template("founder_instructions").format(
+        first_name=_first_name(pilot),
+        pilot_id=pilot.pilot_id,
+    )
+
 
 def generate_founder_instructions(
     pilot: PilotRun,
@@ -30,116 +73,23 @@ def generate_founder_instructions(
     Returns:
         The instructions content.
     """
-    lines = [
-        "HOW TO REVIEW YOUR VIDEO",
-        "=" * 40,
-        "",
-        f"Hi {pilot.founder_name.split()[0]},",
-        "",
-        "Here's how to review the video we've created for you.",
-        "",
-        "",
-        "STEP 1: WATCH THE VIDEO FIRST",
-        "-" * 40,
-        "",
-        "*** IMPORTANT: Watch BEFORE reading any notes. ***",
-        "",
-        "Open final_video.mp4 and watch it all the way through.",
-        "Don't skip ahead to the written materials.",
-        "First impressions matter - we want your gut reaction.",
-        "",
-        "After watching, answer these 3 questions for yourself:",
-        "",
-        "  1. Would you post this? (Yes / Not yet / No way)",
-        "  2. What felt off? (Trust your instincts)",
-        "  3. What would you change first?",
-        "",
-        "Pro tip: Watch it on the device your audience will use.",
-        "If it's for Instagram, watch on your phone.",
-        "",
-        "",
-        "STEP 2: NOW READ THE MARKETING SUMMARY",
-        "-" * 40,
-        "",
-        "Open marketing_summary.txt to see:",
-        "  - Who this video is for",
-        "  - What action we want viewers to take",
-        "  - Key points the video covers",
-        "",
-        "Does this match what you had in mind?",
-        "",
-        "",
-        "STEP 3: CHECK THE DIRECTOR NOTES (OPTIONAL)",
-        "-" * 40,
-        "",
-        "If you're curious why we made certain creative choices,",
-        "director_notes.txt explains our thinking.",
-        "",
-        "This is optional - you don't need to read it to give feedback.",
-        "",
-        "",
-        "STEP 4: GIVE US YOUR FEEDBACK",
-        "-" * 40,
-        "",
-        "Reply with one of these three responses:",
-        "",
-        "  APPROVE",
-        "  --------",
-        "  \"This is ready to publish.\"",
-        "  We're done! You can use this video.",
-        "",
-        "  MINOR CHANGES",
-        "  -------------",
-        "  \"I like it, but please adjust...\"",
-        "  Tell us specific small changes. Examples:",
-        "    - \"The opening is too slow\"",
-        "    - \"Can you make it 5 seconds shorter?\"",
-        "    - \"The ending needs a stronger call-to-action\"",
-        "",
-        "  MAJOR CHANGES",
-        "  -------------",
-        "  \"This doesn't work for me because...\"",
-        "  Tell us what's fundamentally wrong. Examples:",
-        "    - \"The tone is too serious, we're a playful brand\"",
-        "    - \"This misses our key message entirely\"",
-        "    - \"This doesn't feel like our company\"",
-        "",
-        "",
-        "WHAT MAKES GOOD FEEDBACK",
-        "-" * 40,
-        "",
-        "  Good: \"The video feels too slow in the middle section\"",
-        "  Bad:  \"I don't like it\"",
-        "",
-        "  Good: \"Our key message about pricing isn't clear enough\"",
-        "  Bad:  \"It needs to be better\"",
-        "",
-        "  Good: \"The ending should say 'Start your free trial' more prominently\"",
-        "  Bad:  \"Fix the ending\"",
-        "",
-        "The more specific you are, the faster we can make it right.",
-        "",
-        "",
-        "QUESTIONS?",
-        "-" * 40,
-        "",
-        "Just reply to this email with any questions.",
-        f"Please include your Pilot ID: {pilot.pilot_id}",
-        "",
-        "We're here to help!",
-        "",
-    ]
-
-    content = "\n".join(lines)
-
-    if output_path:
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(content)
+    content = _render_founder_instructions(pilot)
+
+    _maybe_write(output_path, content)
 
     return content
 
 
+def _render_what_to_expect(pilot: PilotRun) -> str:
+    """Render the body of what_to_expect.txt."""
+    return _template("what_to_expect").format(
+        first_name=_first_name(pilot),
+        max_attempts=pilot.max_attempts,
+        max_iterations_per_attempt=pilot.max_iterations_per_attempt,
+        pilot_id=pilot.pilot_id,
+    )
+
+
 def generate_what_to_expect(
     pilot: PilotRun,
     output_path: Path | str | None = None,
@@ -155,107 +105,61 @@ def generate_what_to_expect(
     Returns:
         The content.
     """
-    lines = [
-        "WHAT TO EXPECT FROM THIS PILOT",
-        "=" * 40,
-        "",
-        f"Hi {pilot.founder_name.split()[0]},",
-        "",
-        "Here's what you can expect from working with us on this video pilot.",
-        "",
-        "",
-        "TIMELINE",
-        "-" * 40,
-        "",
-        "  Today:     You receive your first video draft",
-        "  24 hours:  We respond to your feedback with a revised version",
-        "  3-5 days:  We aim to reach a final, approved video",
-        "",
-        "Note: This depends on how quickly you can review and give feedback.",
-        "We work fast, but we need your input to improve.",
-        "",
-        "",
-        "HOW MANY ITERATIONS?",
-        "-" * 40,
-        "",
-        f"  Maximum video attempts:  {pilot.max_attempts}",
-        f"  Iterations per attempt:  {pilot.max_iterations_per_attempt}",
-        "",
-        "Most founders approve within 2-3 iterations.",
-        "If we can't get it right in these attempts, we'll discuss next steps.",
-        "",
-        "",
-        "OUTPUT QUALITY",
-        "-" * 40,
-        "",
-        "What you'll get:",
-        "  [x] Professional video structure and pacing",
-        "  [x] Platform-optimized length and format",
-        "  [x] Clear narrative flow and call-to-action",
-        "  [x] Ready-to-publish video file",
-        "",
-        "What this pilot does NOT include:",
-        "  [ ] Custom music (we use placeholder music beds)",
-        "  [ ] Professional voice-over (using synthesized audio)",
-        "  [ ] Custom graphics or animations",
-        "  [ ] 4K or cinema-quality footage",
-        "",
-        "This is about nailing the structure, pacing, and message.",
-        "Production polish comes later.",
-        "",
-        "",
-        "YOUR REVIEW PACK",
-        "-" * 40,
-        "",
-        "Each time we send you a video, you'll get a folder containing:",
-        "",
-        "  final_video.mp4",
-        "    The video file itself. Watch this first.",
-        "",
-        "  marketing_summary.txt",
-        "    Plain-English summary of the video's purpose.",
-        "    Who it's for, what action we want viewers to take.",
-        "",
-        "  director_notes.txt",
-        "    Why we made the creative choices we did.",
-        "    Useful if you want to understand our thinking.",
-        "",
-        "  what_changed_since_last_version.txt",
-        "    After the first version, this explains what we changed.",
-        "    Helps you see if we addressed your feedback.",
-        "",
-        "  recommended_publish_checklist.txt",
-        "    Final checks before you publish the video.",
-        "",
-        "",
-        "WHAT WE NEED FROM YOU",
-        "-" * 40,
-        "",
-        "  1. Watch the video within 24-48 hours",
-        "  2. Give us clear, specific feedback",
-        "  3. Tell us APPROVE, MINOR CHANGES, or MAJOR CHANGES",
-        "",
-        "The faster you respond, the faster we iterate.",
-        "",
-        "",
-        "QUESTIONS?",
-        "-" * 40,
-        "",
-        "Reply to this email anytime.",
-        f"Pilot ID: {pilot.pilot_id}",
-        "",
-    ]
-
-    content = "\n".join(lines)
-
-    if output_path:
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(content)
+    content = _render_what_to_expect(pilot)
+
+    _maybe_write(output_path, content)
 
     return content
 
 
+# Platform-specific approval criteria by scenario type
+_PLATFORM_CRITERIA: dict[str, tuple[str, ...]] = {
+    "feature_launch": (
+        "Video is 30-60 seconds (optimal for social feeds)",
+        "Hook grabs attention in first 3 seconds",
+        "Feature benefit is clearly demonstrated",
+        "Call-to-action is specific (try it, sign up, learn more)",
+    ),
+    "funding_announcement": (
+        "Video is 45-90 seconds (enough for the story)",
+        "Company vision is clearly communicated",
+        "Key metrics or milestones are mentioned",
+        "Ends with forward-looking statement",
+    ),
+    "problem_solution": (
+        "Video is 30-45 seconds (short for cold outreach)",
+        "Problem is immediately relatable",
+        "Solution is clearly positioned",
+        "Call-to-action is low-friction (watch demo, learn more)",
+    ),
+}
+
+_DEFAULT_CRITERIA: tuple[str, ...] = (
+    "Video meets target duration for platform",
+    "Key message is clearly communicated",
+    "Call-to-action is present and clear",
+    "Pacing feels appropriate for the audience",
+)
+
+
+@lru_cache
+def _render_checklist(scenario_type: str) -> str:
+    """Numbered approval checklist for a scenario type."""
+    criteria = _PLATFORM_CRITERIA.get(scenario_type, _DEFAULT_CRITERIA)
+    return "\n".join(
+        f"  {i}. [ ] {criterion}" for i, criterion in enumerate(criteria, 1)
+    )
+
+
+def _render_approval_criteria(pilot: PilotRun) -> str:
+    """Render the body of approval_criteria.txt."""
+    return _template("approval_criteria").format(
+        first_name=_first_name(pilot),
+        criteria=_render_checklist(pilot.scenario_type),
+        pilot_id=pilot.pilot_id,
+    )
+
+
 def generate_approval_criteria(
     pilot: PilotRun,
     output_path: Path | str | None = None,
@@ -269,131 +173,14 @@ def generate_approval_criteria(
     Returns:
         The content.
     """
-    # Determine platform-specific criteria based on scenario
-    platform_criteria = {
-        "feature_launch": [
-            "Video is 30-60 seconds (optimal for social feeds)",
-            "Hook grabs attention in first 3 seconds",
-            "Feature benefit is clearly demonstrated",
-            "Call-to-action is specific (try it, sign up, learn more)",
-        ],
-        "funding_announcement": [
-            "Video is 45-90 seconds (enough for the story)",
-            "Company vision is clearly communicated",
-            "Key metrics or milestones are mentioned",
-            "Ends with forward-looking statement",
-        ],
-        "problem_solution": [
-            "Video is 30-45 seconds (short for cold outreach)",
-            "Problem is immediately relatable",
-            "Solution is clearly positioned",
-            "Call-to-action is low-friction (watch demo, learn more)",
-        ],
-    }
-
-    criteria = platform_criteria.get(pilot.scenario_type, [
-        "Video meets target duration for platform",
-        "Key message is clearly communicated",
-        "Call-to-action is present and clear",
-        "Pacing feels appropriate for the audience",
-    ])
-
-    lines = [
-        "WHAT 'READY TO PUBLISH' MEANS",
-        "=" * 40,
-        "",
-        f"Hi {pilot.founder_name.split()[0]},",
-        "",
-        "Here's how to know when your video is ready to publish.",
-        "",
-        "",
-        "THE APPROVAL CHECKLIST",
-        "-" * 40,
-        "",
-        "Your video is ready to publish when you can say YES to all of these:",
-        "",
-    ]
-
-    for i, criterion in enumerate(criteria, 1):
-        lines.append(f"  {i}. [ ] {criterion}")
-
-    lines.extend([
-        "",
-        "",
-        "BRAND ALIGNMENT",
-        "-" * 40,
-        "",
-        "  [ ] The tone matches how we talk to customers",
-        "  [ ] The visual style feels like our brand",
-        "  [ ] Nothing in the video would embarrass us",
-        "  [ ] We'd be proud to share this with investors",
-        "",
-        "",
-        "TECHNICAL QUALITY",
-        "-" * 40,
-        "",
-        "  [ ] Audio is clear and audible",
-        "  [ ] Transitions are smooth (no jarring cuts)",
-        "  [ ] Text is readable on mobile",
-        "  [ ] No obvious technical glitches",
-        "",
-        "",
-        "BUSINESS READINESS",
-        "-" * 40,
-        "",
-        "  [ ] The message is accurate (no false claims)",
-        "  [ ] Legal has no concerns (if applicable)",
-        "  [ ] Landing page or CTA destination exists",
-        "  [ ] We're ready to handle the response",
-        "",
-        "",
-        "WHEN TO SAY 'APPROVE'",
-        "-" * 40,
-        "",
-        "Say APPROVE when:",
-        "  - You'd publish this video TODAY without changes",
-        "  - You're confident it represents your company well",
-        "  - The message will resonate with your audience",
-        "",
-        "Don't say APPROVE if:",
-        "  - You're settling because you're tired of iterations",
-        "  - You're hoping to 'fix it later'",
-        "  - You have lingering doubts about the message",
-        "",
-        "It's better to ask for one more iteration than to publish",
-        "something you're not proud of.",
-        "",
-        "",
-        "WHAT HAPPENS AFTER APPROVAL",
-        "-" * 40,
-        "",
-        "  1. We mark the video as final",
-        "  2. You receive the approved video file",
-        "  3. You can publish it on your platform",
-        "  4. We collect learnings to improve future videos",
-        "",
-        "That's it! The video is yours to use.",
-        "",
-        "",
-        "QUESTIONS?",
-        "-" * 40,
-        "",
-        f"Pilot ID: {pilot.pilot_id}",
-        "Reply to this email anytime.",
-        "",
-    ])
-
-    content = "\n".join(lines)
-
-    if output_path:
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(content)
+    content = _render_approval_criteria(pilot)
+
+    _maybe_write(output_path, content)
 
     return content
 
 
-@dataclass
+@dataclass(slots=True)
 class FounderArtifacts:
     """Collection of all founder communication artifacts."""
 
@@ -426,9 +213,15 @@ def generate_founder_artifacts(
     expectations_path = output_dir / "what_to_expect.txt"
     criteria_path = output_dir / "approval_criteria.txt"
 
-    instructions = generate_founder_instructions(pilot, instructions_path)
-    expectations = generate_what_to_expect(pilot, expectations_path)
-    criteria = generate_approval_criteria(pilot, criteria_path)
+    # The directory exists now, so write directly rather than through
+    # the public generators, which would each mkdir it again
+    instructions = _render_founder_instructions(pilot)
+    expectations = _render_what_to_expect(pilot)
+    criteria = _render_approval_criteria(pilot)
+
+    _write_text(instructions_path, instructions)
+    _write_text(expectations_path, expectations)
+    _write_text(criteria_path, criteria)
 
     return FounderArtifacts(
         founder_instructions=instructions,
@@ -7,23 +7,31 @@ Key concepts:
 - Founder Satisfaction: What the founder thinks (derived from feedback)
 - System Health: What the system measured (SLA, iterations, cost)
 - Outcome: The final recommendation considering both perspectives
+
+Enum members are singletons, and PilotRun/PilotRunAttempt always hold enum
+members (record_feedback and from_dict convert raw strings), so the hot
+metric loops compare them with `is` rather than `==`.
 """
 
 from __future__ import annotations
 
+import re
 from collections import Counter
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+from functools import lru_cache, partial
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
 
 from src.pilot.run import (
     PilotRun,
     PilotStatus,
     ApprovalOutcome,
     FeedbackDecision,
-    FEEDBACK_FLAGS,
 )
 
 
@@ -90,11 +98,29 @@ class SystemHealthLevel(str, Enum):
     """Multiple metrics indicate systemic issues."""
 
 
+# Recommendation as shown in report headings, e.g. "APPROVED FOR PUBLISH"
+_RECOMMENDATION_DISPLAY: dict[Recommendation, str] = {
+    rec: rec.value.upper().replace("_", " ") for rec in Recommendation
+}
+
+
+@lru_cache(maxsize=256)
+def _flag_label(name: str) -> str:
+    """Flag or theme name with underscores as spaces, e.g. "too slow"."""
+    return name.replace("_", " ")
+
+
+@lru_cache(maxsize=256)
+def _flag_title(name: str) -> str:
+    """Title-cased flag or theme name, e.g. "Too Slow"."""
+    return name.replace("_", " ").title()
+
+
 # =============================================================================
 # ASSESSMENT DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class FounderSatisfaction:
     """Assessment of founder satisfaction from their perspective.
 
@@ -124,7 +150,7 @@ class FounderSatisfaction:
         return len(self.persistent_objections) > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemHealth:
     """Assessment of system health from operational perspective.
 
@@ -154,7 +180,7 @@ class SystemHealth:
         return self.sla_pass_rate < 1.0 or not self.final_sla_passed
 
 
-@dataclass
+@dataclass(slots=True)
 class PilotMetrics:
     """Computed metrics from a pilot."""
 
@@ -176,7 +202,7 @@ class PilotMetrics:
 
     # Enhanced feedback metrics
     feedback_decisions: list[FeedbackDecision | None] = field(default_factory=list)
-    recurring_flags: dict[str, int] = field(default_factory=dict)  # flag -> count
+    recurring_flags: dict[str, int] = field(default_factory=dict)  # flag -> count, most common first
     flags_resolved: list[str] = field(default_factory=list)  # Flags that appeared then disappeared
     flags_persistent: list[str] = field(default_factory=list)  # Flags that kept recurring
     major_changes_count: int = 0
@@ -206,54 +232,76 @@ def compute_pilot_metrics(pilot: PilotRun) -> PilotMetrics:
             final_attempt_sla_passed=False,
             feedback_received_count=0,
             feedback_themes=[],
-            feedback_decisions=[],
-            recurring_flags={},
-            flags_resolved=[],
-            flags_persistent=[],
-            major_changes_count=0,
-            minor_changes_count=0,
-            approve_count=0,
         )
 
-    # Basic counts
+    # Single pass over the attempts for every per-run aggregate
     total_attempts = len(pilot.runs)
-    total_iterations = sum(r.iteration_count for r in pilot.runs)
-    total_cost = sum(r.total_cost_dollars for r in pilot.runs)
+    total_iterations = 0
+    total_cost = 0.0
+    ttfc_total = 0.0
+    ttfc_count = 0
+    sla_passes = 0
+    feedback_received = 0
+    feedback_decisions: list[FeedbackDecision | None] = []
+    approve_count = 0
+    minor_changes_count = 0
+    major_changes_count = 0
+    flag_counts: dict[str, int] = {}
+    flag_last_seen: dict[str, int] = {}
+    feedback_texts: list[str] = []
 
-    # Time to first cut
-    ttfc_values = [r.time_to_first_cut_seconds for r in pilot.runs if r.time_to_first_cut_seconds]
-    avg_ttfc = sum(ttfc_values) / len(ttfc_values) if ttfc_values else None
+    # Enum members bound once rather than looked up on every attempt
+    approve = FeedbackDecision.APPROVE
+    minor_changes = FeedbackDecision.MINOR_CHANGES
+    major_changes = FeedbackDecision.MAJOR_CHANGES
 
-    # Average iterations
-    avg_iterations = total_iterations / total_attempts if total_attempts > 0 else 0.0
+    for run in pilot.runs:
+        total_iterations += run.iteration_count
+        total_cost += run.total_cost_dollars
+
+        if run.time_to_first_cut_seconds:
+            ttfc_total += run.time_to_first_cut_seconds
+            ttfc_count += 1
+
+        if run.sla_passed:
+            sla_passes += 1
+        if run.has_feedback:
+            feedback_received += 1
+        if run.founder_feedback:
+            feedback_texts.append(run.founder_feedback)
+
+        decision = run.feedback_decision
+        feedback_decisions.append(decision)
+        if decision is approve:
+            approve_count += 1
+        elif decision is minor_changes:
+            minor_changes_count += 1
+        elif decision is major_changes:
+            major_changes_count += 1
 
-    # SLA pass rate
-    sla_passes = sum(1 for r in pilot.runs if r.sla_passed)
-    sla_pass_rate = sla_passes / total_attempts if total_attempts > 0 else 0.0
+        for flag in run.feedback_flags:
+            flag_counts[flag] = flag_counts.get(flag, 0) + 1
+            flag_last_seen[flag] = run.attempt_number
+
+    # Averages and rates
+    avg_ttfc = ttfc_total / ttfc_count if ttfc_count else None
+    avg_iterations = total_iterations / total_attempts
+    sla_pass_rate = sla_passes / total_attempts
 
     # Approval rate (1.0 if approved, 0.0 otherwise)
-    approval_rate = 1.0 if pilot.approval_outcome == ApprovalOutcome.APPROVED else 0.0
+    approval_rate = 1.0 if pilot.approval_outcome is ApprovalOutcome.APPROVED else 0.0
 
     # First and final SLA status
-    first_sla = pilot.runs[0].sla_passed if pilot.runs else False
-    final_sla = pilot.runs[-1].sla_passed if pilot.runs else False
-
-    # Feedback analysis - enhanced
-    feedback_received = sum(1 for r in pilot.runs if r.has_feedback)
+    first_sla = pilot.runs[0].sla_passed
+    final_sla = pilot.runs[-1].sla_passed
 
     # Extract themes from feedback (legacy method)
-    themes = _extract_feedback_themes(pilot)
-
-    # Collect feedback decisions
-    feedback_decisions = [r.feedback_decision for r in pilot.runs]
-
-    # Count decision types
-    major_changes_count = sum(1 for d in feedback_decisions if d == FeedbackDecision.MAJOR_CHANGES)
-    minor_changes_count = sum(1 for d in feedback_decisions if d == FeedbackDecision.MINOR_CHANGES)
-    approve_count = sum(1 for d in feedback_decisions if d == FeedbackDecision.APPROVE)
+    themes = _extract_feedback_themes(feedback_texts)
 
     # Analyze flags across attempts
-    recurring_flags, flags_resolved, flags_persistent = _analyze_feedback_flags(pilot)
+    recurring_flags, flags_resolved, flags_persistent = _analyze_feedback_flags(
+        pilot, flag_counts, flag_last_seen,
+    )
 
     return PilotMetrics(
         total_attempts=total_attempts,
@@ -277,76 +325,86 @@ def compute_pilot_metrics(pilot: PilotRun) -> PilotMetrics:
     )
 
 
-def _extract_feedback_themes(pilot: PilotRun) -> list[str]:
+# Keywords that indicate each feedback theme, in report order
+_THEME_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "too_long": ("too long", "shorten", "shorter", "cut down", "too slow"),
+    "too_short": ("too short", "longer", "more detail", "expand"),
+    "pacing": ("pacing", "pace", "fast", "slow", "rhythm"),
+    "hook": ("hook", "opening", "start", "beginning", "grab"),
+    "ending": ("ending", "end", "cta", "call to action", "conclusion"),
+    "tone": ("tone", "voice", "feel", "vibe", "mood"),
+    "message": ("message", "point", "key", "main", "unclear"),
+    "brand": ("brand", "doesn't feel", "not us", "off-brand"),
+}
+
+# One named group per theme inside a lookahead, so a single scan reports
+# every keyword occurrence, including ones nested inside another theme's
+# keyword (e.g. "slow" inside "too slow"). No keyword is a prefix of a
+# keyword from a different theme, so each position matches at most one theme.
+_THEME_PATTERN = re.compile(
+    "(?=" + "|".join(
+        f"(?P<{theme}>" + "|".join(re.escape(k) for k in keywords) + ")"
+        for theme, keywords in _THEME_KEYWORDS.items()
+    ) + ")",
+    re.IGNORECASE,
+)
+
+
+def _extract_feedback_themes(feedback: list[str]) -> list[str]:
     """Extract common themes from founder feedback.
 
     Simple keyword-based extraction.
+
+    Args:
+        feedback: Non-empty founder feedback texts, in attempt order.
     """
-    themes = []
-
-    # Keywords to look for
-    theme_keywords = {
-        "too_long": ["too long", "shorten", "shorter", "cut down", "too slow"],
-        "too_short": ["too short", "longer", "more detail", "expand"],
-        "pacing": ["pacing", "pace", "fast", "slow", "rhythm"],
-        "hook": ["hook", "opening", "start", "beginning", "grab"],
-        "ending": ["ending", "end", "cta", "call to action", "conclusion"],
-        "tone": ["tone", "voice", "feel", "vibe", "mood"],
-        "message": ["message", "point", "key", "main", "unclear"],
-        "brand": ["brand", "doesn't feel", "not us", "off-brand"],
-    }
-
-    # Collect all feedback text
-    all_feedback = " ".join(
-        r.founder_feedback.lower()
-        for r in pilot.runs
-        if r.founder_feedback
-    )
+    if not feedback:
+        return []
+    all_feedback = " ".join(feedback)
 
-    # Check for themes
-    for theme, keywords in theme_keywords.items():
-        for keyword in keywords:
-            if keyword in all_feedback:
-                themes.append(theme)
-                break
+    # Check for themes in a single pass, stopping once every theme is found
+    found: set[str] = set()
+    for match in _THEME_PATTERN.finditer(all_feedback):
+        found.add(match.lastgroup)
+        if len(found) == len(_THEME_KEYWORDS):
+            break
 
-    return themes
+    return [theme for theme in _THEME_KEYWORDS if theme in found]
 
 
-def _analyze_feedback_flags(pilot: PilotRun) -> tuple[dict[str, int], list[str], list[str]]:
+def _analyze_feedback_flags(
+    pilot: PilotRun,
+    flag_counts: dict[str, int],
+    flag_last_seen: dict[str, int],
+) -> tuple[dict[str, int], list[str], list[str]]:
     """Analyze feedback flags across attempts.
 
+    Args:
+        pilot: The pilot the flags were collected from.
+        flag_counts: Occurrences of each flag across attempts.
+        flag_last_seen: Last attempt number each flag appeared in.
+
     Returns:
         Tuple of (recurring_flags count, resolved flags, persistent flags).
+        recurring_flags is ordered by count descending, ties in first-seen
+        order; reports rely on this to pick the top objections.
     """
-    # Count occurrences of each flag
-    flag_counts: Counter[str] = Counter()
-    flag_first_seen: dict[str, int] = {}
-    flag_last_seen: dict[str, int] = {}
-
-    for run in pilot.runs:
-        for flag in run.feedback_flags:
-            flag_counts[flag] += 1
-            if flag not in flag_first_seen:
-                flag_first_seen[flag] = run.attempt_number
-            flag_last_seen[flag] = run.attempt_number
-
-    recurring_flags = dict(flag_counts.most_common())
+    # Order is part of the contract, so the count-descending sort stays
+    recurring_flags = dict(sorted(flag_counts.items(), key=itemgetter(1), reverse=True))
 
     # Identify resolved flags (appeared early, not in later attempts)
     flags_resolved = []
     flags_persistent = []
 
-    if pilot.runs and len(pilot.runs) >= 2:
+    if len(pilot.runs) >= 2:
         final_attempt = pilot.runs[-1].attempt_number
 
-        for flag, count in flag_counts.items():
-            last_seen = flag_last_seen[flag]
-
+        # flag_last_seen shares flag_counts' first-seen key order
+        for flag, last_seen in flag_last_seen.items():
             # If flag was last seen before the final attempt, it's resolved
             if last_seen < final_attempt:
                 flags_resolved.append(flag)
-            elif count >= 2:
+            elif flag_counts[flag] >= 2:
                 # If seen in multiple attempts including the last, it's persistent
                 flags_persistent.append(flag)
 
@@ -357,6 +415,14 @@ def _analyze_feedback_flags(pilot: PilotRun) -> tuple[dict[str, int], list[str],
 # ASSESSMENT FUNCTIONS
 # =============================================================================
 
+# Satisfaction implied by the founder's latest decision
+_SATISFACTION_BY_DECISION: dict[FeedbackDecision, FounderSatisfactionLevel] = {
+    FeedbackDecision.APPROVE: FounderSatisfactionLevel.SATISFIED,
+    FeedbackDecision.MINOR_CHANGES: FounderSatisfactionLevel.CLOSE,
+    FeedbackDecision.MAJOR_CHANGES: FounderSatisfactionLevel.UNSATISFIED,
+}
+
+
 def assess_founder_satisfaction(
     pilot: PilotRun,
     metrics: PilotMetrics,
@@ -365,27 +431,40 @@ def assess_founder_satisfaction(
 
     This answers: "Is the founder happy with what we delivered?"
     """
-    # Get latest feedback decision
-    latest_decision = None
-    if pilot.runs and pilot.runs[-1].feedback_decision:
-        latest_decision = pilot.runs[-1].feedback_decision
+    outcome = pilot.approval_outcome
+    if (
+        not pilot.runs
+        and outcome is not ApprovalOutcome.DROPPED
+        and outcome is not ApprovalOutcome.APPROVED
+    ):
+        return FounderSatisfaction(
+            level=FounderSatisfactionLevel.UNKNOWN,
+            latest_decision=None,
+            approval_count=0,
+            major_changes_count=0,
+            minor_changes_count=0,
+            persistent_objections=[],
+            resolved_objections=[],
+            trajectory="unknown",
+        )
+
+    # Decisions were collected per attempt by compute_pilot_metrics, so
+    # neither the latest decision nor the trajectory re-walks pilot.runs
+    decisions = metrics.feedback_decisions
+    latest_decision = decisions[-1] if decisions else None
 
     # Determine satisfaction level
-    if pilot.approval_outcome == ApprovalOutcome.DROPPED:
+    if outcome is ApprovalOutcome.DROPPED:
         level = FounderSatisfactionLevel.ABANDONED
-    elif latest_decision == FeedbackDecision.APPROVE:
-        level = FounderSatisfactionLevel.SATISFIED
-    elif latest_decision == FeedbackDecision.MINOR_CHANGES:
-        level = FounderSatisfactionLevel.CLOSE
-    elif latest_decision == FeedbackDecision.MAJOR_CHANGES:
-        level = FounderSatisfactionLevel.UNSATISFIED
-    elif pilot.approval_outcome == ApprovalOutcome.APPROVED:
+    elif latest_decision in _SATISFACTION_BY_DECISION:
+        level = _SATISFACTION_BY_DECISION[latest_decision]
+    elif outcome is ApprovalOutcome.APPROVED:
         level = FounderSatisfactionLevel.SATISFIED
     else:
         level = FounderSatisfactionLevel.UNKNOWN
 
     # Determine trajectory
-    trajectory = _determine_feedback_trajectory(pilot)
+    trajectory = _determine_feedback_trajectory(decisions)
 
     return FounderSatisfaction(
         level=level,
@@ -399,6 +478,32 @@ def assess_founder_satisfaction(
     )
 
 
+# Operational thresholds (example values - could be configurable)
+_MAX_IDEAL_ATTEMPTS = 3
+_MAX_AVG_ITERATIONS = 2.5
+_MAX_COST_DOLLARS = 10.0
+
+
+@dataclass(frozen=True, slots=True)
+class _HealthFlags:
+    """Which operational metrics are within their thresholds."""
+
+    sla_ok: bool
+    attempts_ok: bool
+    iterations_ok: bool
+    cost_ok: bool
+
+
+def _compute_health_flags(metrics: PilotMetrics) -> _HealthFlags:
+    """Compare metrics against the operational thresholds once."""
+    return _HealthFlags(
+        sla_ok=metrics.sla_pass_rate >= 1.0,
+        attempts_ok=metrics.total_attempts <= _MAX_IDEAL_ATTEMPTS,
+        iterations_ok=metrics.average_iterations_per_attempt <= _MAX_AVG_ITERATIONS,
+        cost_ok=metrics.total_cost_dollars <= _MAX_COST_DOLLARS,
+    )
+
+
 def assess_system_health(
     pilot: PilotRun,
     metrics: PilotMetrics,
@@ -408,23 +513,24 @@ def assess_system_health(
     This answers: "Did our system perform well operationally?"
     """
     concerns = []
+    flags = _compute_health_flags(metrics)
 
     # Check SLA
-    if metrics.sla_pass_rate < 1.0:
+    if not flags.sla_ok:
         concerns.append(f"SLA pass rate only {metrics.sla_pass_rate:.0%}")
     if not metrics.final_attempt_sla_passed:
         concerns.append("Final attempt failed SLA")
 
     # Check attempts
-    if metrics.total_attempts > 3:
-        concerns.append(f"Required {metrics.total_attempts} attempts (ideal: ≤3)")
+    if not flags.attempts_ok:
+        concerns.append(f"Required {metrics.total_attempts} attempts (ideal: ≤{_MAX_IDEAL_ATTEMPTS})")
 
     # Check iterations
-    if metrics.average_iterations_per_attempt > 2.5:
+    if not flags.iterations_ok:
         concerns.append(f"High iteration count ({metrics.average_iterations_per_attempt:.1f} avg)")
 
-    # Check cost (example threshold - could be configurable)
-    if metrics.total_cost_dollars > 10.0:
+    # Check cost
+    if not flags.cost_ok:
         concerns.append(f"High cost (${metrics.total_cost_dollars:.2f})")
 
     # Determine health level
@@ -447,22 +553,34 @@ def assess_system_health(
     )
 
 
-def _determine_feedback_trajectory(pilot: PilotRun) -> str:
-    """Determine if feedback is improving, stable, or declining."""
-    if len(pilot.runs) < 2:
-        return "unknown"
+# Ordinal rank of each decision; higher is closer to approval
+_DECISION_RANK: dict[FeedbackDecision, int] = {
+    FeedbackDecision.MAJOR_CHANGES: 0,
+    FeedbackDecision.MINOR_CHANGES: 1,
+    FeedbackDecision.APPROVE: 2,
+}
 
-    decision_values = {
-        FeedbackDecision.MAJOR_CHANGES: 0,
-        FeedbackDecision.MINOR_CHANGES: 1,
-        FeedbackDecision.APPROVE: 2,
-    }
+
+# Same ranking for the legacy string feedback_level field
+_FEEDBACK_LEVEL_RANK: dict[str, int] = {"major_changes": 0, "minor_changes": 1, "approve": 2}
+
+
+def _determine_feedback_trajectory(
+    feedback_decisions: Sequence[FeedbackDecision | None],
+) -> str:
+    """Determine if feedback is improving, stable, or declining.
+
+    Args:
+        feedback_decisions: Decision per attempt (None if not yet given).
+    """
+    if len(feedback_decisions) < 2:
+        return "unknown"
 
     # Get decisions for runs that have feedback
     decisions = [
-        decision_values.get(r.feedback_decision, -1)
-        for r in pilot.runs
-        if r.feedback_decision is not None
+        _DECISION_RANK.get(d, -1)
+        for d in feedback_decisions
+        if d is not None
     ]
 
     if len(decisions) < 2:
@@ -529,7 +647,7 @@ def _generate_founder_safe_explanation(
             )
     else:  # STOP_PILOT
         if founder_satisfaction.persistent_objections:
-            issues = ", ".join(o.replace("_", " ") for o in founder_satisfaction.persistent_objections[:2])
+            issues = ", ".join(_flag_label(o) for o in founder_satisfaction.persistent_objections[:2])
             explanation = (
                 f"This pilot encountered fundamental challenges. Despite {metrics.total_attempts} attempts, "
                 f"we couldn't resolve issues around {issues}. This suggests this type of video may not be "
@@ -570,16 +688,13 @@ def _generate_founder_call_summary(
         latest_decision = pilot.runs[-1].feedback_decision
 
     # Build the narrative
-    if latest_decision == FeedbackDecision.APPROVE:
-        lines.append(_get_approve_narrative(pilot, metrics))
-    elif latest_decision == FeedbackDecision.MINOR_CHANGES:
-        lines.append(_get_minor_changes_narrative(pilot, metrics))
-    elif latest_decision == FeedbackDecision.MAJOR_CHANGES:
-        lines.append(_get_major_changes_narrative(pilot, metrics))
-    elif pilot.approval_outcome == ApprovalOutcome.DROPPED:
-        lines.append(_get_dropped_narrative(pilot, metrics))
-    else:
-        lines.append(_get_ongoing_narrative(pilot, metrics))
+    narrative = _NARRATIVE_BY_DECISION.get(latest_decision)
+    if narrative is None:
+        if pilot.approval_outcome == ApprovalOutcome.DROPPED:
+            narrative = _get_dropped_narrative
+        else:
+            narrative = _get_ongoing_narrative
+    lines.append(narrative(pilot, metrics))
 
     lines.append("")
     return lines
@@ -587,53 +702,53 @@ def _generate_founder_call_summary(
 
 def _get_approve_narrative(pilot: PilotRun, metrics: PilotMetrics) -> str:
     """Generate narrative for approved pilots."""
-    base = f"> \"Yeah, we got a good video out of this."
-
-    if metrics.total_attempts == 1:
-        base += " First try, actually. Pretty impressed.\""
-    elif metrics.total_attempts == 2:
-        base += " Took a couple of rounds but we got there.\""
-    elif metrics.total_attempts <= 3:
-        base += f" It took {metrics.total_attempts} attempts, but the final result works for us.\""
+    attempts = metrics.total_attempts
+
+    if attempts == 1:
+        detail = "First try, actually. Pretty impressed."
+    elif attempts == 2:
+        detail = "Took a couple of rounds but we got there."
+    elif attempts <= 3:
+        detail = f"It took {attempts} attempts, but the final result works for us."
     else:
-        base += f" Not gonna lie, took {metrics.total_attempts} attempts. But in the end, we got something we can use.\""
+        detail = f"Not gonna lie, took {attempts} attempts. But in the end, we got something we can use."
 
-    return base
+    return f"> \"Yeah, we got a good video out of this. {detail}\""
 
 
 def _get_minor_changes_narrative(pilot: PilotRun, metrics: PilotMetrics) -> str:
     """Generate narrative for minor changes status."""
-    base = "> \"We're close."
-
     if metrics.flags_persistent:
-        top_issue = metrics.flags_persistent[0].replace("_", " ")
-        base += f" Still have some {top_issue} issues to work out."
+        top_issue = _flag_label(metrics.flags_persistent[0])
+        detail = f" Still have some {top_issue} issues to work out."
     elif metrics.recurring_flags:
-        top_issue = list(metrics.recurring_flags.keys())[0].replace("_", " ")
-        base += f" The {top_issue} thing keeps coming up, but it's getting better."
+        top_issue = _flag_label(next(iter(metrics.recurring_flags)))
+        detail = f" The {top_issue} thing keeps coming up, but it's getting better."
+    else:
+        detail = ""
 
-    base += " One more round should do it.\""
-    return base
+    return f"> \"We're close.{detail} One more round should do it.\""
 
 
 def _get_major_changes_narrative(pilot: PilotRun, metrics: PilotMetrics) -> str:
     """Generate narrative for major changes status."""
     if metrics.major_changes_count >= 2:
-        base = "> \"We've been going back and forth on this."
-
         if metrics.flags_persistent:
-            issues = ", ".join(f.replace("_", " ") for f in metrics.flags_persistent[:2])
-            base += f" The {issues} keeps being a problem."
-        base += " Starting to wonder if we need a different approach.\""
-    else:
-        base = "> \"This isn't quite what we're looking for."
-
-        if metrics.recurring_flags:
-            top_issue = list(metrics.recurring_flags.keys())[0].replace("_", " ")
-            base += f" The main issue is {top_issue}."
-        base += " Needs significant rework.\""
+            issues = ", ".join(_flag_label(f) for f in metrics.flags_persistent[:2])
+            detail = f" The {issues} keeps being a problem."
+        else:
+            detail = ""
+        return (
+            f"> \"We've been going back and forth on this.{detail}"
+            " Starting to wonder if we need a different approach.\""
+        )
 
-    return base
+    if metrics.recurring_flags:
+        top_issue = _flag_label(next(iter(metrics.recurring_flags)))
+        detail = f" The main issue is {top_issue}."
+    else:
+        detail = ""
+    return f"> \"This isn't quite what we're looking for.{detail} Needs significant rework.\""
 
 
 def _get_dropped_narrative(pilot: PilotRun, metrics: PilotMetrics) -> str:
@@ -642,7 +757,7 @@ def _get_dropped_narrative(pilot: PilotRun, metrics: PilotMetrics) -> str:
         return "> \"It wasn't what we expected at all. We decided not to continue after the first video.\""
 
     if metrics.flags_persistent:
-        issues = ", ".join(f.replace("_", " ") for f in metrics.flags_persistent[:2])
+        issues = ", ".join(_flag_label(f) for f in metrics.flags_persistent[:2])
         return f"> \"We tried {metrics.total_attempts} times but kept running into the same {issues} issues. Had to walk away.\""
 
     return f"> \"After {metrics.total_attempts} attempts, we just couldn't get it right. Decided to put this on hold.\""
@@ -659,6 +774,14 @@ def _get_ongoing_narrative(pilot: PilotRun, metrics: PilotMetrics) -> str:
     return f"> \"We're {metrics.total_attempts} videos in. Still working on it.\""
 
 
+# Call-summary narrative for each latest decision
+_NARRATIVE_BY_DECISION: dict[FeedbackDecision, Callable[[PilotRun, PilotMetrics], str]] = {
+    FeedbackDecision.APPROVE: _get_approve_narrative,
+    FeedbackDecision.MINOR_CHANGES: _get_minor_changes_narrative,
+    FeedbackDecision.MAJOR_CHANGES: _get_major_changes_narrative,
+}
+
+
 def determine_recommendation(
     pilot: PilotRun,
     metrics: PilotMetrics,
@@ -688,36 +811,38 @@ def determine_recommendation(
     if system_health is None:
         system_health = assess_system_health(pilot, metrics)
 
+    major_changes = metrics.major_changes_count
+    persistent = founder_satisfaction.persistent_objections
+    approved = founder_satisfaction.is_approved
+    dropped = pilot.approval_outcome is ApprovalOutcome.DROPPED
+
     # =========================================================================
     # STOP_PILOT: Fundamental problems - don't continue this pilot type
     # =========================================================================
+    # Every check below returns STOP_PILOT, so they are ordered cheapest first
 
-    # No convergence after max attempts
-    if metrics.total_attempts >= pilot.max_attempts:
-        if not founder_satisfaction.is_approved:
-            return Recommendation.STOP_PILOT
-
-    # Repeated MAJOR_CHANGES with same persistent issues = not converging
-    if metrics.major_changes_count >= 2 and founder_satisfaction.persistent_objections:
+    # 3+ MAJOR_CHANGES = fundamental misalignment
+    if major_changes >= 3:
         return Recommendation.STOP_PILOT
 
-    # 3+ MAJOR_CHANGES = fundamental misalignment
-    if metrics.major_changes_count >= 3:
+    # Repeated MAJOR_CHANGES with same persistent issues = not converging
+    if major_changes >= 2 and persistent:
         return Recommendation.STOP_PILOT
 
-    # Dropped after first attempt = major misalignment
-    if pilot.approval_outcome == ApprovalOutcome.DROPPED and metrics.total_attempts == 1:
+    # Dropped after first attempt = major misalignment;
+    # dropped with persistent issues = we couldn't solve it
+    if dropped and (metrics.total_attempts == 1 or persistent):
         return Recommendation.STOP_PILOT
 
-    # Dropped with persistent issues = we couldn't solve it
-    if pilot.approval_outcome == ApprovalOutcome.DROPPED and founder_satisfaction.persistent_objections:
+    # No convergence after max attempts
+    if metrics.total_attempts >= pilot.max_attempts and not approved:
         return Recommendation.STOP_PILOT
 
     # =========================================================================
     # APPROVED_FOR_PUBLISH / APPROVED_WITH_RISK: Founder approved
     # =========================================================================
 
-    if founder_satisfaction.is_approved:
+    if approved:
         # Founder is happy - but check system health
         if system_health.is_healthy:
             return Recommendation.APPROVED_FOR_PUBLISH
@@ -730,11 +855,11 @@ def determine_recommendation(
     # =========================================================================
 
     # Repeated MAJOR_CHANGES (even without persistent flags)
-    if metrics.major_changes_count >= 2:
+    if major_changes >= 2:
         return Recommendation.REVISE_REQUIRED
 
     # Dropped but not immediately (founder tried but gave up)
-    if pilot.approval_outcome == ApprovalOutcome.DROPPED:
+    if dropped:
         return Recommendation.REVISE_REQUIRED
 
     # Declining trajectory
@@ -787,7 +912,7 @@ def _get_recommendation_reasoning(
 
     else:  # STOP_PILOT
         if founder_satisfaction.persistent_objections:
-            issues = ", ".join(o.replace("_", " ") for o in founder_satisfaction.persistent_objections[:2])
+            issues = ", ".join(_flag_label(o) for o in founder_satisfaction.persistent_objections[:2])
             return (
                 f"Persistent issues ({issues}) were never resolved despite multiple attempts. "
                 "This suggests a fundamental mismatch between what we can deliver and what "
@@ -801,9 +926,54 @@ def _get_recommendation_reasoning(
             )
 
 
+def _utc_timestamp() -> str:
+    """Current UTC time as shown in report headers."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+
+
+# Large enough that a typical report goes out in a single write
+_REPORT_WRITE_BUFFER_SIZE = 1 << 16
+
+
+def _write_report(path: Path, content: str) -> None:
+    """Write a markdown report as UTF-8 through one large buffer."""
+    with path.open("w", encoding="utf-8", buffering=_REPORT_WRITE_BUFFER_SIZE) as f:
+        f.write(content)
+
+
+# Status column of the operational metrics table, keyed by "within threshold"
+_ISSUE_STATUS = {True: "OK", False: "ISSUE"}
+_HIGH_STATUS = {True: "OK", False: "HIGH"}
+
+
+# Report title and summary table; rendered with str.format. The trailing
+# newline leaves a blank line once the report lines are joined.
+_REPORT_HEADER_TEMPLATE = """\
+# Pilot Outcome Report
+
+**Pilot ID:** {pilot_id}
+**Generated:** {generated}
+
+---
+
+## Summary
+
+| Field | Value |
+|-------|-------|
+| Founder | {founder} |
+| Company | {company} |
+| Scenario | {scenario} |
+| Status | {status} |
+
+### Final Recommendation: **{recommendation}**
+"""
+
+
 def generate_pilot_outcome_report(
     pilot: PilotRun,
     output_path: Path | str | None = None,
+    metrics: PilotMetrics | None = None,
+    generated_at: str | None = None,
 ) -> str:
     """Generate a pilot outcome report.
 
@@ -813,39 +983,34 @@ def generate_pilot_outcome_report(
     Args:
         pilot: The completed (or in-progress) pilot.
         output_path: Optional path to write the report.
+        metrics: Pre-computed metrics (optional, will compute if not provided).
+        generated_at: Pre-formatted generation timestamp (optional, defaults
+            to the current UTC time).
 
     Returns:
         The report content as markdown.
     """
-    metrics = compute_pilot_metrics(pilot)
+    if metrics is None:
+        metrics = compute_pilot_metrics(pilot)
     founder_satisfaction = assess_founder_satisfaction(pilot, metrics)
     system_health = assess_system_health(pilot, metrics)
     recommendation = determine_recommendation(pilot, metrics, founder_satisfaction, system_health)
     reasoning = _get_recommendation_reasoning(recommendation, founder_satisfaction, system_health)
 
     # Format recommendation for display
-    rec_display = recommendation.value.upper().replace("_", " ")
+    rec_display = _RECOMMENDATION_DISPLAY[recommendation]
 
     # Build report
     lines = [
-        "# Pilot Outcome Report",
-        "",
-        f"**Pilot ID:** {pilot.pilot_id}",
-        f"**Generated:** {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}",
-        "",
-        "---",
-        "",
-        "## Summary",
-        "",
-        f"| Field | Value |",
-        f"|-------|-------|",
-        f"| Founder | {pilot.founder_name} |",
-        f"| Company | {pilot.company_name} |",
-        f"| Scenario | {pilot.scenario_type} |",
-        f"| Status | {pilot.status.value.upper()} |",
-        "",
-        f"### Final Recommendation: **{rec_display}**",
-        "",
+        _REPORT_HEADER_TEMPLATE.format(
+            pilot_id=pilot.pilot_id,
+            generated=generated_at or _utc_timestamp(),
+            founder=pilot.founder_name,
+            company=pilot.company_name,
+            scenario=pilot.scenario_type,
+            status=pilot.status.value.upper(),
+            recommendation=rec_display,
+        ),
     ]
 
     # Add founder-safe explanation right at the top
@@ -878,7 +1043,7 @@ def generate_pilot_outcome_report(
             "",
         ])
         for objection in founder_satisfaction.persistent_objections:
-            lines.append(f"- {objection.replace('_', ' ').title()}")
+            lines.append(f"- {_flag_title(objection)}")
         lines.append("")
 
     if founder_satisfaction.resolved_objections:
@@ -887,7 +1052,7 @@ def generate_pilot_outcome_report(
             "",
         ])
         for objection in founder_satisfaction.resolved_objections:
-            lines.append(f"- {objection.replace('_', ' ').title()}")
+            lines.append(f"- {_flag_title(objection)}")
         lines.append("")
 
     # Feedback history summary
@@ -917,6 +1082,7 @@ def generate_pilot_outcome_report(
     ])
 
     # System metrics
+    health_flags = _compute_health_flags(metrics)
     if metrics.average_time_to_first_cut_seconds:
         ttfc_formatted = f"{metrics.average_time_to_first_cut_seconds:.1f}s"
     else:
@@ -927,11 +1093,11 @@ def generate_pilot_outcome_report(
         "",
         f"| Metric | Value | Status |",
         f"|--------|-------|--------|",
-        f"| SLA Pass Rate | {system_health.sla_pass_rate:.0%} | {'OK' if system_health.sla_pass_rate == 1.0 else 'ISSUE'} |",
+        f"| SLA Pass Rate | {system_health.sla_pass_rate:.0%} | {_ISSUE_STATUS[health_flags.sla_ok]} |",
         f"| Final SLA | {'PASS' if system_health.final_sla_passed else 'FAIL'} | {'OK' if system_health.final_sla_passed else 'ISSUE'} |",
-        f"| Total Attempts | {system_health.total_attempts} | {'OK' if system_health.total_attempts <= 3 else 'HIGH'} |",
-        f"| Avg Iterations | {system_health.average_iterations_per_attempt:.1f} | {'OK' if system_health.average_iterations_per_attempt <= 2.5 else 'HIGH'} |",
-        f"| Total Cost | ${system_health.total_cost_dollars:.2f} | {'OK' if system_health.total_cost_dollars <= 10.0 else 'HIGH'} |",
+        f"| Total Attempts | {system_health.total_attempts} | {_HIGH_STATUS[health_flags.attempts_ok]} |",
+        f"| Avg Iterations | {system_health.average_iterations_per_attempt:.1f} | {_HIGH_STATUS[health_flags.iterations_ok]} |",
+        f"| Total Cost | ${system_health.total_cost_dollars:.2f} | {_HIGH_STATUS[health_flags.cost_ok]} |",
         f"| Time to First Cut | {ttfc_formatted} | - |",
         "",
     ])
@@ -961,8 +1127,8 @@ def generate_pilot_outcome_report(
             "## Top Recurring Founder Objections",
             "",
         ])
-        for flag, count in list(metrics.recurring_flags.items())[:5]:
-            flag_display = flag.replace("_", " ").title()
+        for flag, count in islice(metrics.recurring_flags.items(), 5):
+            flag_display = _flag_title(flag)
             lines.append(f"- **{flag_display}** ({count}x)")
         lines.append("")
 
@@ -973,7 +1139,7 @@ def generate_pilot_outcome_report(
                 "",
             ])
             for flag in metrics.flags_resolved:
-                lines.append(f"- {flag.replace('_', ' ').title()}")
+                lines.append(f"- {_flag_title(flag)}")
             lines.append("")
 
         if metrics.flags_persistent:
@@ -982,7 +1148,7 @@ def generate_pilot_outcome_report(
                 "",
             ])
             for flag in metrics.flags_persistent:
-                lines.append(f"- {flag.replace('_', ' ').title()}")
+                lines.append(f"- {_flag_title(flag)}")
             lines.append("")
 
     # Legacy feedback themes (from text analysis)
@@ -994,7 +1160,7 @@ def generate_pilot_outcome_report(
             "",
         ])
         for theme in metrics.feedback_themes:
-            lines.append(f"- **{theme.replace('_', ' ').title()}**")
+            lines.append(f"- **{_flag_title(theme)}**")
         lines.append("")
 
     # Attempt history - enhanced with feedback details
@@ -1008,6 +1174,10 @@ def generate_pilot_outcome_report(
             "|---|-----|------------|------|----------|-------|",
         ])
 
+        # One pass over the attempts fills both the table and the
+        # detailed-feedback section that follows it
+        details: list[str] = []
+
         for run in pilot.runs:
             sla_status = "PASS" if run.sla_passed else "FAIL"
             decision = run.feedback_decision.value.upper() if run.feedback_decision else (run.feedback_level or "-")
@@ -1017,33 +1187,35 @@ def generate_pilot_outcome_report(
                 f"${run.total_cost_dollars:.2f} | {decision} | {flags} |"
             )
 
-        lines.append("")
-
-        # Detailed feedback per attempt
-        lines.extend([
-            "### Detailed Feedback by Attempt",
-            "",
-        ])
-
-        for run in pilot.runs:
             if run.has_feedback:
                 decision = run.feedback_decision.value.upper() if run.feedback_decision else run.feedback_level or "N/A"
                 mode = f" ({run.feedback_mode.value})" if run.feedback_mode else ""
-                lines.append(f"**Attempt {run.attempt_number}** - {decision}{mode}")
+                details.append(f"**Attempt {run.attempt_number}** - {decision}{mode}")
 
                 if run.feedback_flags:
-                    flags_display = ", ".join(f.replace("_", " ") for f in run.feedback_flags)
-                    lines.append(f"- Flags: {flags_display}")
+                    flags_display = ", ".join(_flag_label(f) for f in run.feedback_flags)
+                    details.append(f"- Flags: {flags_display}")
 
-                if run.feedback_notes:
+                notes = run.feedback_notes
+                if notes:
                     # Truncate long notes
-                    notes = run.feedback_notes[:200] + "..." if len(run.feedback_notes) > 200 else run.feedback_notes
-                    lines.append(f"- Notes: \"{notes}\"")
+                    if len(notes) > 200:
+                        notes = f"{notes[:200]}..."
+                    details.append(f"- Notes: \"{notes}\"")
 
-                lines.append("")
+                details.append("")
             else:
-                lines.append(f"**Attempt {run.attempt_number}** - No feedback received")
-                lines.append("")
+                details.append(f"**Attempt {run.attempt_number}** - No feedback received")
+                details.append("")
+
+        lines.append("")
+
+        # Detailed feedback per attempt
+        lines.extend([
+            "### Detailed Feedback by Attempt",
+            "",
+        ])
+        lines.extend(details)
 
     # What improved
     if metrics.total_attempts > 1:
@@ -1069,29 +1241,23 @@ def generate_pilot_outcome_report(
             improvements.append(f"Reduced iterations by {diff}")
 
         # Feedback decision improvement
-        decision_order = {
-            FeedbackDecision.MAJOR_CHANGES: 0,
-            FeedbackDecision.MINOR_CHANGES: 1,
-            FeedbackDecision.APPROVE: 2,
-        }
         first_decision = first.feedback_decision
         last_decision = last.feedback_decision
         if first_decision and last_decision:
-            if decision_order.get(last_decision, -1) > decision_order.get(first_decision, -1):
+            if _DECISION_RANK.get(last_decision, -1) > _DECISION_RANK.get(first_decision, -1):
                 improvements.append(f"Feedback improved: {first_decision.value} → {last_decision.value}")
 
         # Legacy feedback level check
         elif first.feedback_level and last.feedback_level:
-            level_order = {"major_changes": 0, "minor_changes": 1, "approve": 2}
-            first_level = level_order.get(first.feedback_level, -1)
-            last_level = level_order.get(last.feedback_level, -1)
+            first_level = _FEEDBACK_LEVEL_RANK.get(first.feedback_level, -1)
+            last_level = _FEEDBACK_LEVEL_RANK.get(last.feedback_level, -1)
             if last_level > first_level:
                 improvements.append("Feedback level improved")
 
         # Flag resolution
         if metrics.flags_resolved:
             for flag in metrics.flags_resolved:
-                improvements.append(f"Resolved: {flag.replace('_', ' ')}")
+                improvements.append(f"Resolved: {_flag_label(flag)}")
 
         if improvements:
             for imp in improvements:
@@ -1153,8 +1319,8 @@ def generate_pilot_outcome_report(
             "1. **Publish the video** (founder approved)",
             "2. **Investigate system concerns** before next pilot:",
         ])
-        for concern in system_health.concerns:
-            lines.append(f"   - {concern}")
+        if system_health.concerns:
+            lines.append("\n".join(f"   - {concern}" for concern in system_health.concerns))
         lines.extend([
             "3. Adjust playbook if needed",
             "4. Monitor next pilot closely",
@@ -1165,8 +1331,9 @@ def generate_pilot_outcome_report(
             "2. Review feedback patterns:",
         ])
         if founder_satisfaction.persistent_objections:
-            for obj in founder_satisfaction.persistent_objections[:3]:
-                lines.append(f"   - {obj.replace('_', ' ').title()}")
+            lines.append("\n".join(
+                f"   - {_flag_title(obj)}" for obj in founder_satisfaction.persistent_objections[:3]
+            ))
         lines.extend([
             "3. Update playbook to address issues",
             "4. Discuss with team what went wrong",
@@ -1202,14 +1369,94 @@ def generate_pilot_outcome_report(
     if output_path:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(content)
+        _write_report(output_path, content)
 
     return content
 
 
+# Rendering a report costs about as much as pickling its pilot to a worker,
+# so the pool only has a chance to pay for its start-up on large batches
+_PARALLEL_REPORTS_MIN_PILOTS = 512
+
+
+def generate_pilot_outcome_reports(
+    pilots: Iterable[PilotRun],
+    max_workers: int | None = None,
+    output_dir: Path | str | None = None,
+) -> list[str]:
+    """Generate outcome reports for many pilots.
+
+    Reports are built in-process by default. Passing max_workers > 1
+    opts in to a process pool, used only for batches of at least
+    _PARALLEL_REPORTS_MIN_PILOTS; below that, pool start-up and pickling
+    cost more than rendering. Callers using the pool must guard their
+    entry point with `if __name__ == "__main__":` under the spawn start
+    method.
+
+    Args:
+        pilots: Pilots to report on.
+        max_workers: Worker process count; None or 1 keeps the batch
+            in-process.
+        output_dir: Optional directory to write each report to, as
+            <pilot_id>.md. The directory is created once for the batch.
+
+    Returns:
+        One report per pilot, in input order.
+    """
+    pilots = list(pilots)
+    # One timestamp for the whole batch instead of a clock read per report
+    render = partial(generate_pilot_outcome_report, generated_at=_utc_timestamp())
+    if max_workers is None or max_workers <= 1 or len(pilots) < _PARALLEL_REPORTS_MIN_PILOTS:
+        reports = [render(p) for p in pilots]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            reports = list(executor.map(render, pilots, chunksize=16))
+
+    if output_dir:
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for pilot, content in zip(pilots, reports):
+            _write_report(output_dir / f"{pilot.pilot_id}.md", content)
+
+    return reports
+
+
+# Title, overview and aggregate metrics tables; rendered with str.format
+_MULTI_REPORT_HEADER_TEMPLATE = """\
+# Multi-Pilot Aggregate Report
+
+**Generated:** {generated}
+**Pilots Analyzed:** {total_pilots}
+
+---
+
+## Overview
+
+| Metric | Value |
+|--------|-------|
+| Total pilots | {total_pilots} |
+| Completed | {completed} |
+| Approved | {approved} ({approved_rate:.0%}) |
+| Dropped | {dropped} ({dropped_rate:.0%}) |
+
+---
+
+## Aggregate Metrics
+
+| Metric | Value |
+|--------|-------|
+| Total video attempts | {total_attempts} |
+| Avg attempts/pilot | {avg_attempts:.1f} |
+| Total iterations | {total_iterations} |
+| Avg iterations/pilot | {avg_iterations:.1f} |
+| Total cost | ${total_cost:.2f} |
+| Avg cost/pilot | ${avg_cost:.2f} |"""
+
+
 def generate_multi_pilot_report(
     pilots: list[PilotRun],
     output_path: Path | str | None = None,
+    generated_at: str | None = None,
 ) -> str:
     """Generate an aggregate report across multiple pilots.
 
@@ -1218,6 +1465,8 @@ def generate_multi_pilot_report(
     Args:
         pilots: List of pilots to analyze.
         output_path: Optional path to write the report.
+        generated_at: Pre-formatted generation timestamp (optional, defaults
+            to the current UTC time).
 
     Returns:
         The report content as markdown.
@@ -1227,59 +1476,63 @@ def generate_multi_pilot_report(
 
     # Compute aggregate metrics
     total_pilots = len(pilots)
-    completed = [p for p in pilots if p.status == PilotStatus.COMPLETED]
-    approved = [p for p in pilots if p.approval_outcome == ApprovalOutcome.APPROVED]
-    dropped = [p for p in pilots if p.approval_outcome == ApprovalOutcome.DROPPED]
-
     all_metrics = [compute_pilot_metrics(p) for p in pilots]
 
-    total_attempts = sum(m.total_attempts for m in all_metrics)
-    total_iterations = sum(m.total_iterations for m in all_metrics)
-    total_cost = sum(m.total_cost_dollars for m in all_metrics)
-
-    # Average time to first cut
-    ttfc_values = [m.average_time_to_first_cut_seconds for m in all_metrics if m.average_time_to_first_cut_seconds]
-    avg_ttfc = sum(ttfc_values) / len(ttfc_values) if ttfc_values else None
-
-    # Feedback themes across all pilots
-    all_themes: list[str] = []
-    for m in all_metrics:
-        all_themes.extend(m.feedback_themes)
-    theme_counts = Counter(all_themes)
-
-    # Recommendations
-    recommendations = [determine_recommendation(p, m) for p, m in zip(pilots, all_metrics)]
-    rec_counts = Counter(r.value for r in recommendations)
+    # Single pass over the pilots for every aggregate
+    completed_count = 0
+    approved_count = 0
+    dropped_count = 0
+    total_attempts = 0
+    total_iterations = 0
+    total_cost = 0.0
+    ttfc_total = 0.0
+    ttfc_count = 0
+    theme_counts: Counter[str] = Counter()
+    recommendations: list[Recommendation] = []
+    rec_counts: dict[Recommendation, int] = {}
+
+    for p, m in zip(pilots, all_metrics):
+        if p.status is PilotStatus.COMPLETED:
+            completed_count += 1
+        if p.approval_outcome is ApprovalOutcome.APPROVED:
+            approved_count += 1
+        elif p.approval_outcome is ApprovalOutcome.DROPPED:
+            dropped_count += 1
+
+        total_attempts += m.total_attempts
+        total_iterations += m.total_iterations
+        total_cost += m.total_cost_dollars
+
+        # Pilots without a first cut yet don't count toward the average
+        if m.average_time_to_first_cut_seconds:
+            ttfc_total += m.average_time_to_first_cut_seconds
+            ttfc_count += 1
+
+        # Feedback themes across all pilots
+        theme_counts.update(m.feedback_themes)
+
+        rec = determine_recommendation(p, m)
+        recommendations.append(rec)
+        rec_counts[rec] = rec_counts.get(rec, 0) + 1
+
+    avg_ttfc = ttfc_total / ttfc_count if ttfc_count else None
 
     lines = [
-        "# Multi-Pilot Aggregate Report",
-        "",
-        f"**Generated:** {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}",
-        f"**Pilots Analyzed:** {total_pilots}",
-        "",
-        "---",
-        "",
-        "## Overview",
-        "",
-        "| Metric | Value |",
-        "|--------|-------|",
-        f"| Total pilots | {total_pilots} |",
-        f"| Completed | {len(completed)} |",
-        f"| Approved | {len(approved)} ({len(approved)/total_pilots:.0%}) |",
-        f"| Dropped | {len(dropped)} ({len(dropped)/total_pilots:.0%}) |",
-        "",
-        "---",
-        "",
-        "## Aggregate Metrics",
-        "",
-        "| Metric | Value |",
-        "|--------|-------|",
-        f"| Total video attempts | {total_attempts} |",
-        f"| Avg attempts/pilot | {total_attempts/total_pilots:.1f} |",
-        f"| Total iterations | {total_iterations} |",
-        f"| Avg iterations/pilot | {total_iterations/total_pilots:.1f} |",
-        f"| Total cost | ${total_cost:.2f} |",
-        f"| Avg cost/pilot | ${total_cost/total_pilots:.2f} |",
+        _MULTI_REPORT_HEADER_TEMPLATE.format(
+            generated=generated_at or _utc_timestamp(),
+            total_pilots=total_pilots,
+            completed=completed_count,
+            approved=approved_count,
+            approved_rate=approved_count / total_pilots,
+            dropped=dropped_count,
+            dropped_rate=dropped_count / total_pilots,
+            total_attempts=total_attempts,
+            avg_attempts=total_attempts / total_pilots,
+            total_iterations=total_iterations,
+            avg_iterations=total_iterations / total_pilots,
+            total_cost=total_cost,
+            avg_cost=total_cost / total_pilots,
+        ),
     ]
 
     if avg_ttfc:
@@ -1295,7 +1548,7 @@ def generate_multi_pilot_report(
 
     if theme_counts:
         for theme, count in theme_counts.most_common(5):
-            lines.append(f"- **{theme.replace('_', ' ').title()}**: {count} pilots")
+            lines.append(f"- **{_flag_title(theme)}**: {count} pilots")
     else:
         lines.append("- No common themes detected")
 
@@ -1308,7 +1561,7 @@ def generate_multi_pilot_report(
     ])
 
     for rec in [Recommendation.PROCEED, Recommendation.REVISE, Recommendation.STOP]:
-        count = rec_counts.get(rec.value, 0)
+        count = rec_counts.get(rec, 0)
         lines.append(f"- **{rec.value.upper()}**: {count} pilots ({count/total_pilots:.0%})")
 
     lines.extend([
@@ -1340,6 +1593,6 @@ def generate_multi_pilot_report(
     if output_path:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(content)
+        _write_report(output_path, content)
 
     return content
@@ -6,19 +6,64 @@ multiple video generation attempts and their outcomes.
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import secrets
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+from functools import cache
 from pathlib import Path
 from typing import Any
-import uuid
 
 from src.common.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+@cache
+def _orjson() -> Any:
+    """Import orjson on first use, so importing this module stays cheap.
+
+    Returns:
+        The orjson module, or None if it is not installed.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _dumps(data: dict[str, Any]) -> bytes:
+    """Encode pilot data as indented JSON, using orjson when installed."""
+    orjson = _orjson()
+    if orjson is not None:
+        # NON_STR_KEYS stringifies int/enum keys (e.g. in brand_context)
+        # as json.dumps does; orjson rejects them by default
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _loads(raw: bytes) -> dict[str, Any]:
+    """Decode pilot JSON, using orjson when installed."""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _parse_dt(value: str | None) -> datetime | None:
+    """Parse an ISO 8601 timestamp as written by to_dict.
+
+    Only ISO input is accepted (datetime.fromisoformat raises on anything
+    else); a missing value yields None.
+    """
+    return datetime.fromisoformat(value) if value else None
+
+
 class PilotStatus(str, Enum):
     """Status of a pilot engagement."""
 
@@ -68,6 +113,18 @@ class FeedbackDecision(str, Enum):
     """Significant rework required."""
 
 
+# Value -> member tables for from_dict; a plain dict lookup skips the
+# Enum constructor on every load. Unknown values fall back to the
+# constructor so they still raise ValueError.
+_STATUS_BY_VALUE = {s.value: s for s in PilotStatus}
+_OUTCOME_BY_VALUE = {o.value: o for o in ApprovalOutcome}
+_MODE_BY_VALUE = {m.value: m for m in FeedbackMode}
+_DECISION_BY_VALUE = {d.value: d for d in FeedbackDecision}
+
+# Legacy feedback_level strings, in either case, to FeedbackDecision
+_DECISION_BY_LEVEL = {**_DECISION_BY_VALUE, **{d.name: d for d in FeedbackDecision}}
+
+
 # Standard feedback flags that founders commonly use
 FEEDBACK_FLAGS = [
     "hook_weak",        # Opening doesn't grab attention
@@ -86,7 +143,7 @@ FEEDBACK_FLAGS = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class PilotRunAttempt:
     """A single video generation attempt within a pilot."""
 
@@ -127,6 +184,10 @@ class PilotRunAttempt:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
+        # Each of these feeds both a new field and its legacy alias
+        decision = self.feedback_decision.value if self.feedback_decision else None
+        timestamp = self.feedback_timestamp.isoformat() if self.feedback_timestamp else None
+        received_at = self.feedback_received_at
         return {
             "attempt_id": self.attempt_id,
             "attempt_number": self.attempt_number,
@@ -140,52 +201,41 @@ class PilotRunAttempt:
             "sla_violations": self.sla_violations,
             # New feedback fields
             "feedback_mode": self.feedback_mode.value if self.feedback_mode else None,
-            "feedback_decision": self.feedback_decision.value if self.feedback_decision else None,
+            "feedback_decision": decision,
             "feedback_flags": self.feedback_flags,
             "feedback_notes": self.feedback_notes,
-            "feedback_timestamp": self.feedback_timestamp.isoformat() if self.feedback_timestamp else None,
+            "feedback_timestamp": timestamp,
             "feedback_persona": self.feedback_persona,
             # Legacy fields for backward compatibility
             "founder_feedback": self.founder_feedback or self.feedback_notes,
-            "feedback_received_at": (
-                self.feedback_received_at.isoformat() if self.feedback_received_at
-                else (self.feedback_timestamp.isoformat() if self.feedback_timestamp else None)
-            ),
-            "feedback_level": self.feedback_level or (self.feedback_decision.value if self.feedback_decision else None),
+            "feedback_received_at": received_at.isoformat() if received_at else timestamp,
+            "feedback_level": self.feedback_level or decision,
         }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "PilotRunAttempt":
         """Create from dictionary with backward compatibility."""
-        created_at = data.get("created_at")
-        if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at)
-        else:
-            created_at = datetime.now(timezone.utc)
+        created_at = _parse_dt(data.get("created_at")) or datetime.now(timezone.utc)
 
         # Handle feedback_timestamp (new) or feedback_received_at (legacy)
-        feedback_timestamp = data.get("feedback_timestamp") or data.get("feedback_received_at")
-        if isinstance(feedback_timestamp, str):
-            feedback_timestamp = datetime.fromisoformat(feedback_timestamp)
+        feedback_timestamp = _parse_dt(
+            data.get("feedback_timestamp") or data.get("feedback_received_at")
+        )
 
         # Handle feedback_mode
         feedback_mode = None
-        if data.get("feedback_mode"):
-            feedback_mode = FeedbackMode(data["feedback_mode"])
+        mode = data.get("feedback_mode")
+        if mode:
+            feedback_mode = _MODE_BY_VALUE.get(mode) or FeedbackMode(mode)
 
         # Handle feedback_decision (new) or feedback_level (legacy)
         feedback_decision = None
-        if data.get("feedback_decision"):
-            feedback_decision = FeedbackDecision(data["feedback_decision"])
+        decision = data.get("feedback_decision")
+        if decision:
+            feedback_decision = _DECISION_BY_VALUE.get(decision) or FeedbackDecision(decision)
         elif data.get("feedback_level"):
             # Map legacy feedback_level to FeedbackDecision
-            level = data["feedback_level"]
-            if level in ("approve", "APPROVE"):
-                feedback_decision = FeedbackDecision.APPROVE
-            elif level in ("minor_changes", "MINOR_CHANGES"):
-                feedback_decision = FeedbackDecision.MINOR_CHANGES
-            elif level in ("major_changes", "MAJOR_CHANGES"):
-                feedback_decision = FeedbackDecision.MAJOR_CHANGES
+            feedback_decision = _DECISION_BY_LEVEL.get(data["feedback_level"])
 
         # Handle feedback_notes (new) or founder_feedback (legacy)
         feedback_notes = data.get("feedback_notes") or data.get("founder_feedback") or ""
@@ -215,7 +265,7 @@ class PilotRunAttempt:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PilotRun:
     """A pilot engagement with a founder.
 
@@ -260,10 +310,11 @@ class PilotRun:
         sla_violations: list[str] | None = None,
     ) -> PilotRunAttempt:
         """Add a new attempt to this pilot."""
+        now = datetime.now(timezone.utc)
         attempt = PilotRunAttempt(
-            attempt_id=f"attempt_{len(self.runs) + 1}_{uuid.uuid4().hex[:8]}",
+            attempt_id=f"attempt_{len(self.runs) + 1}_{secrets.token_hex(4)}",
             attempt_number=len(self.runs) + 1,
-            created_at=datetime.now(timezone.utc),
+            created_at=now,
             video_path=video_path,
             review_pack_path=review_pack_path,
             time_to_first_cut_seconds=time_to_first_cut_seconds,
@@ -273,7 +324,7 @@ class PilotRun:
             sla_violations=sla_violations or [],
         )
         self.runs.append(attempt)
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = now
 
         logger.info(
             "pilot_attempt_added",
@@ -307,43 +358,49 @@ class PilotRun:
         if isinstance(decision, str):
             decision = FeedbackDecision(decision.lower())
 
-        for attempt in self.runs:
-            if attempt.attempt_number == attempt_number:
-                now = datetime.now(timezone.utc)
-
-                # New fields
-                attempt.feedback_mode = mode
-                attempt.feedback_decision = decision
-                attempt.feedback_flags = flags or []
-                attempt.feedback_notes = notes
-                attempt.feedback_timestamp = now
-                attempt.feedback_persona = persona
-
-                # Legacy fields for backward compatibility
-                attempt.founder_feedback = notes
-                attempt.feedback_received_at = now
-                attempt.feedback_level = decision.value
-
-                self.updated_at = now
-
-                # Auto-approve pilot if decision is APPROVE
-                if decision == FeedbackDecision.APPROVE:
-                    self.mark_approved()
-
-                logger.info(
-                    "pilot_feedback_recorded",
-                    pilot_id=self.pilot_id,
-                    attempt_number=attempt_number,
-                    decision=decision.value,
-                    mode=mode.value,
-                    flags=flags,
-                )
-                return
-
-        raise ValueError(f"Attempt {attempt_number} not found")
+        attempt = self.get_attempt(attempt_number)
+        if attempt is None:
+            raise ValueError(f"Attempt {attempt_number} not found")
+
+        now = datetime.now(timezone.utc)
+
+        # New fields
+        attempt.feedback_mode = mode
+        attempt.feedback_decision = decision
+        attempt.feedback_flags = flags or []
+        attempt.feedback_notes = notes
+        attempt.feedback_timestamp = now
+        attempt.feedback_persona = persona
+
+        # Legacy fields for backward compatibility
+        attempt.founder_feedback = notes
+        attempt.feedback_received_at = now
+        attempt.feedback_level = decision.value
+
+        # Auto-approve pilot if decision is APPROVE
+        if decision == FeedbackDecision.APPROVE:
+            self.mark_approved()
+
+        # After mark_approved, so updated_at matches the feedback time
+        self.updated_at = now
+
+        logger.info(
+            "pilot_feedback_recorded",
+            pilot_id=self.pilot_id,
+            attempt_number=attempt_number,
+            decision=decision.value,
+            mode=mode.value,
+            flags=flags,
+        )
 
     def get_attempt(self, attempt_number: int) -> PilotRunAttempt | None:
         """Get a specific attempt by number."""
+        # add_attempt numbers attempts 1..N in order, so try the direct
+        # index first; scan only if runs were assembled some other way
+        if 1 <= attempt_number <= len(self.runs):
+            attempt = self.runs[attempt_number - 1]
+            if attempt.attempt_number == attempt_number:
+                return attempt
         for attempt in self.runs:
             if attempt.attempt_number == attempt_number:
                 return attempt
@@ -453,17 +510,11 @@ class PilotRun:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "PilotRun":
         """Create from dictionary."""
-        created_at = data.get("created_at")
-        if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at)
-        else:
-            created_at = datetime.now(timezone.utc)
-
-        updated_at = data.get("updated_at")
-        if isinstance(updated_at, str):
-            updated_at = datetime.fromisoformat(updated_at)
-        else:
-            updated_at = datetime.now(timezone.utc)
+        now = datetime.now(timezone.utc)
+        created_at = _parse_dt(data.get("created_at")) or now
+        updated_at = _parse_dt(data.get("updated_at")) or now
+        status = data.get("status", "active")
+        outcome = data.get("approval_outcome", "pending")
 
         return cls(
             pilot_id=data["pilot_id"],
@@ -473,8 +524,8 @@ class PilotRun:
             brand_context=data.get("brand_context", {}),
             playbook_version=data.get("playbook_version"),
             runs=[PilotRunAttempt.from_dict(r) for r in data.get("runs", [])],
-            status=PilotStatus(data.get("status", "active")),
-            approval_outcome=ApprovalOutcome(data.get("approval_outcome", "pending")),
+            status=_STATUS_BY_VALUE.get(status) or PilotStatus(status),
+            approval_outcome=_OUTCOME_BY_VALUE.get(outcome) or ApprovalOutcome(outcome),
             created_at=created_at,
             updated_at=updated_at,
             notes=data.get("notes", ""),
@@ -506,7 +557,8 @@ def create_pilot(
     Returns:
         New PilotRun instance.
     """
-    pilot_id = f"pilot_{datetime.now(timezone.utc).strftime('%Y%m%d')}_{uuid.uuid4().hex[:8]}"
+    now = datetime.now(timezone.utc)
+    pilot_id = f"pilot_{now.strftime('%Y%m%d')}_{secrets.token_hex(4)}"
 
     pilot = PilotRun(
         pilot_id=pilot_id,
@@ -517,6 +569,8 @@ def create_pilot(
         playbook_version=playbook_version,
         max_attempts=max_attempts,
         max_iterations_per_attempt=max_iterations_per_attempt,
+        created_at=now,
+        updated_at=now,
     )
 
     logger.info(
@@ -530,10 +584,55 @@ def create_pilot(
     return pilot
 
 
+# Below this many files, thread start-up costs more than overlapping reads saves
+_PARALLEL_READ_MIN_PILOTS = 16
+_MAX_READ_THREADS = 32
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write data to a private sibling .tmp file, then os.replace it onto path.
+
+    Readers never see a truncated file, even if the process dies mid-write.
+    The temp name carries the pid and a random token and is opened with
+    O_EXCL, so concurrent saves of the same file never share a temp file.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{secrets.token_hex(4)}.tmp")
+    tmp_file = open(tmp_path, "xb")
+    try:
+        with tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _read_if_exists(path: Path) -> bytes | None:
+    """Read a pilot file, or None if it was removed since it was listed."""
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _digest(raw: bytes) -> bytes:
+    """Fingerprint of a pilot file's contents."""
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
 class PilotStore:
     """Persistent storage for pilot runs.
 
-    Stores pilot metadata as JSON files in a directory.
+    Stores pilot metadata as JSON files in a directory. Encoding uses
+    orjson when installed (pip install krag-video-platform[perf]) and
+    falls back to the standard json module otherwise.
+
+    Each store keeps an in-memory index of every pilot's founder, status
+    and creation time, so list queries only decode the pilots they return.
+    Entries are keyed by a digest of the file's bytes: every query reads
+    the pilot files and re-decodes only those whose content changed, so
+    pilots saved by other stores (or processes) are always seen with
+    their current status. Queries never write to the storage directory.
     """
 
     def __init__(self, storage_dir: Path | str):
@@ -544,11 +643,53 @@ class PilotStore:
         """
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        # pilot_id -> (digest of the file contents, index entry)
+        self._index: dict[str, tuple[bytes, dict[str, Any]]] = {}
 
     def _pilot_path(self, pilot_id: str) -> Path:
         """Get the path for a pilot's JSON file."""
         return self.storage_dir / f"{pilot_id}.json"
 
+    @staticmethod
+    def _index_entry(pilot: PilotRun) -> dict[str, Any]:
+        """Fields the list queries filter and sort on."""
+        return {
+            "founder_name": pilot.founder_name,
+            "status": pilot.status.value,
+            "created_at": pilot.created_at,
+        }
+
+    def _read_pilot_files(self) -> dict[str, bytes]:
+        """Current contents of every pilot file, keyed by pilot_id."""
+        paths = list(self.storage_dir.glob("pilot_*.json"))
+        if len(paths) < _PARALLEL_READ_MIN_PILOTS:
+            raw_files = [_read_if_exists(path) for path in paths]
+        else:
+            # File reads release the GIL, so threads overlap the disk waits
+            with ThreadPoolExecutor(max_workers=min(_MAX_READ_THREADS, len(paths))) as pool:
+                raw_files = list(pool.map(_read_if_exists, paths))
+        return {
+            path.stem: raw
+            for path, raw in zip(paths, raw_files)
+            if raw is not None
+        }
+
+    def _refresh_index(self, raw_files: dict[str, bytes]) -> dict[str, dict[str, Any]]:
+        """Bring the in-memory index up to date with the given file contents.
+
+        Files whose digest matches their entry are not decoded again;
+        entries for files that are gone are dropped.
+        """
+        index: dict[str, tuple[bytes, dict[str, Any]]] = {}
+        for pilot_id, raw in raw_files.items():
+            digest = _digest(raw)
+            cached = self._index.get(pilot_id)
+            if cached is None or cached[0] != digest:
+                cached = (digest, self._index_entry(PilotRun.from_dict(_loads(raw))))
+            index[pilot_id] = cached
+        self._index = index
+        return {pilot_id: entry for pilot_id, (_, entry) in index.items()}
+
     def save(self, pilot: PilotRun) -> Path:
         """Save a pilot to disk.
 
@@ -559,8 +700,9 @@ class PilotStore:
             Path to the saved file.
         """
         path = self._pilot_path(pilot.pilot_id)
-        with open(path, "w") as f:
-            json.dump(pilot.to_dict(), f, indent=2)
+        data = _dumps(pilot.to_dict())
+        _atomic_write(path, data)
+        self._index[pilot.pilot_id] = (_digest(data), self._index_entry(pilot))
 
         logger.debug("pilot_saved", pilot_id=pilot.pilot_id, path=str(path))
         return path
@@ -578,10 +720,24 @@ class PilotStore:
         if not path.exists():
             return None
 
-        with open(path) as f:
-            data = json.load(f)
+        return PilotRun.from_dict(_loads(path.read_bytes()))
 
-        return PilotRun.from_dict(data)
+    @staticmethod
+    def _matching_ids(
+        index: dict[str, dict[str, Any]],
+        status: PilotStatus | None = None,
+        founder_name: str | None = None,
+    ) -> list[str]:
+        """Pilot IDs matching the filters, newest first, from the index alone."""
+        founder = founder_name.lower() if founder_name else None
+        matches = [
+            (entry["created_at"], pid)
+            for pid, entry in index.items()
+            if not (status and entry["status"] != status)
+            and not (founder and entry["founder_name"].lower() != founder)
+        ]
+        matches.sort(key=lambda m: m[0], reverse=True)
+        return [pid for _, pid in matches]
 
     def list_pilots(
         self,
@@ -595,25 +751,14 @@ class PilotStore:
             founder_name: Filter by founder name.
 
         Returns:
-            List of matching pilots.
+            List of matching pilots, newest first.
         """
-        pilots = []
-        for path in self.storage_dir.glob("pilot_*.json"):
-            with open(path) as f:
-                data = json.load(f)
-            pilot = PilotRun.from_dict(data)
-
-            # Apply filters
-            if status and pilot.status != status:
-                continue
-            if founder_name and pilot.founder_name.lower() != founder_name.lower():
-                continue
-
-            pilots.append(pilot)
-
-        # Sort by created_at descending (newest first)
-        pilots.sort(key=lambda p: p.created_at, reverse=True)
-        return pilots
+        raw_files = self._read_pilot_files()
+        index = self._refresh_index(raw_files)
+        return [
+            PilotRun.from_dict(_loads(raw_files[pid]))
+            for pid in self._matching_ids(index, status, founder_name)
+        ]
 
     def get_active_pilots(self) -> list[PilotRun]:
         """Get all active pilots."""
@@ -621,5 +766,15 @@ class PilotStore:
 
     def get_pilot_by_founder(self, founder_name: str) -> PilotRun | None:
         """Get the most recent pilot for a founder."""
-        pilots = self.list_pilots(founder_name=founder_name)
-        return pilots[0] if pilots else None
+        # Single pass over the index for the newest match; only it is decoded
+        raw_files = self._read_pilot_files()
+        founder = founder_name.lower()
+        best_id: str | None = None
+        best_created: datetime | None = None
+        for pilot_id, entry in self._refresh_index(raw_files).items():
+            if founder and entry["founder_name"].lower() != founder:
+                continue
+            created = entry["created_at"]
+            if best_created is None or created > best_created:
+                best_id, best_created = pilot_id, created
+        return PilotRun.from_dict(_loads(raw_files[best_id])) if best_id else None
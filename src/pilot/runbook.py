@@ -7,6 +7,7 @@ commitments to the founder.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -34,6 +35,150 @@ class RunbookConfig:
     non_promises: list[str] | None = None
 
 
+# Default runbook content, used when RunbookConfig leaves a field unset
+_DEFAULT_SECONDARY_GOALS: tuple[str, ...] = (
+    "Measure time-to-first-cut for this scenario type",
+    "Identify common feedback patterns for playbook improvement",
+    "Validate SLA constraints for the target platform",
+)
+
+_DEFAULT_SUCCESS_CRITERIA: tuple[str, ...] = (
+    "Founder approves at least one video for publishing",
+    "Time-to-first-cut under 2 minutes",
+    "No more than 3 iterations needed for approval",
+    "SLA constraints met (duration, shot count, pacing)",
+)
+
+_DEFAULT_FEEDBACK_AREAS: tuple[str, ...] = (
+    "Overall video quality and professionalism",
+    "Pacing - too fast, too slow, or just right",
+    "Hook effectiveness - does it grab attention?",
+    "Ending clarity - is the call-to-action clear?",
+    "Tone alignment - does it match the brand voice?",
+    "Key message - does the main point come through?",
+)
+
+# Promises after the two pilot-specific limits
+_DEFAULT_FIXED_PROMISES: tuple[str, ...] = (
+    "Review pack with each video for easy feedback",
+    "Plain-English marketing summary (no jargon)",
+    "Director notes explaining creative decisions",
+    "Response to feedback within 24 hours",
+)
+
+_DEFAULT_NON_PROMISES: tuple[str, ...] = (
+    "Final production-quality video (this is draft quality)",
+    "Custom music or voice-over (using placeholders)",
+    "Unlimited revisions (we have defined limits)",
+    "Guaranteed approval (we're testing, not selling)",
+    "Timeline commitments (this is a pilot)",
+)
+
+
+# Runbook layout; list sections are pre-rendered blocks
+_RUNBOOK_TEMPLATE = """\
+============================================================
+PILOT RUNBOOK
+============================================================
+
+Pilot ID:     {pilot_id}
+Founder:      {founder_name}
+Company:      {company_name}
+Scenario:     {scenario_type}
+Created:      {created}
+
+------------------------------------------------------------
+WHAT WE ARE TESTING
+------------------------------------------------------------
+
+Primary Goal:
+  {primary_goal}
+
+Secondary Goals:
+{secondary_goals}
+
+------------------------------------------------------------
+WHAT SUCCESS LOOKS LIKE
+------------------------------------------------------------
+
+{success_criteria}
+
+------------------------------------------------------------
+ITERATION LIMITS
+------------------------------------------------------------
+
+  Maximum video attempts:         {max_attempts}
+  Max iterations per attempt:     {max_iterations}
+  Total possible iterations:      {total_iterations}
+
+  If we hit these limits without approval, we will:
+    1. Analyze feedback patterns
+    2. Update our playbook
+    3. Discuss next steps with founder
+
+------------------------------------------------------------
+FEEDBACK WE WANT FROM THE FOUNDER
+------------------------------------------------------------
+
+{feedback_areas}
+
+  Feedback format:
+    - APPROVE: Ready to publish as-is
+    - MINOR CHANGES: Small tweaks needed (specify what)
+    - MAJOR CHANGES: Significant rework needed (specify issues)
+
+------------------------------------------------------------
+WHAT WE PROMISE
+------------------------------------------------------------
+
+{promises}
+
+------------------------------------------------------------
+WHAT WE DON'T PROMISE
+------------------------------------------------------------
+
+{non_promises}
+
+------------------------------------------------------------
+PILOT TIMELINE
+------------------------------------------------------------
+
+  Day 1:    Initial video generation
+  Day 1-2:  Founder review and feedback
+  Day 2-3:  Iterations based on feedback
+  Day 3-5:  Final approval or decision to stop
+
+  Note: Timeline is approximate and depends on founder availability.
+
+------------------------------------------------------------
+CONTACT & SUPPORT
+------------------------------------------------------------
+
+  For questions or issues:
+    - Reply to the email that sent this pilot
+    - Include the Pilot ID in all communications
+
+============================================================
+Generated: {generated}
+============================================================
+"""
+
+
+# A runbook is a few KiB; one buffer holds the whole file for a single write
+_WRITE_BUFFER_SIZE = 1 << 16
+
+
+def _write_runbook(path: Path, content: str) -> None:
+    """Write the runbook as UTF-8 with a single buffered write."""
+    with path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(content)
+
+
+def _bullets(items: Sequence[str], prefix: str) -> str:
+    """Indented bullet block, one item per line."""
+    return "\n".join(f"  {prefix}{item}" for item in items)
+
+
 def generate_pilot_runbook(
     pilot: PilotRun,
     config: RunbookConfig | None = None,
@@ -54,167 +199,42 @@ def generate_pilot_runbook(
     """
     config = config or RunbookConfig()
 
-    # Build default values
-    secondary_goals = config.secondary_goals or [
-        "Measure time-to-first-cut for this scenario type",
-        "Identify common feedback patterns for playbook improvement",
-        "Validate SLA constraints for the target platform",
-    ]
-
-    success_criteria = config.success_criteria or [
-        "Founder approves at least one video for publishing",
-        "Time-to-first-cut under 2 minutes",
-        "No more than 3 iterations needed for approval",
-        "SLA constraints met (duration, shot count, pacing)",
-    ]
-
-    feedback_areas = config.feedback_areas or [
-        "Overall video quality and professionalism",
-        "Pacing - too fast, too slow, or just right",
-        "Hook effectiveness - does it grab attention?",
-        "Ending clarity - is the call-to-action clear?",
-        "Tone alignment - does it match the brand voice?",
-        "Key message - does the main point come through?",
-    ]
-
-    promises = config.promises or [
+    secondary_goals = config.secondary_goals or _DEFAULT_SECONDARY_GOALS
+    success_criteria = config.success_criteria or _DEFAULT_SUCCESS_CRITERIA
+    feedback_areas = config.feedback_areas or _DEFAULT_FEEDBACK_AREAS
+    promises = config.promises or (
         f"Up to {pilot.max_attempts} video attempts",
         f"Up to {pilot.max_iterations_per_attempt} refinement iterations per attempt",
-        "Review pack with each video for easy feedback",
-        "Plain-English marketing summary (no jargon)",
-        "Director notes explaining creative decisions",
-        "Response to feedback within 24 hours",
-    ]
-
-    non_promises = config.non_promises or [
-        "Final production-quality video (this is draft quality)",
-        "Custom music or voice-over (using placeholders)",
-        "Unlimited revisions (we have defined limits)",
-        "Guaranteed approval (we're testing, not selling)",
-        "Timeline commitments (this is a pilot)",
-    ]
-
-    # Generate runbook content
-    lines = [
-        "=" * 60,
-        "PILOT RUNBOOK",
-        "=" * 60,
-        "",
-        f"Pilot ID:     {pilot.pilot_id}",
-        f"Founder:      {pilot.founder_name}",
-        f"Company:      {pilot.company_name}",
-        f"Scenario:     {pilot.scenario_type}",
-        f"Created:      {pilot.created_at.strftime('%Y-%m-%d %H:%M UTC')}",
-        "",
-        "-" * 60,
-        "WHAT WE ARE TESTING",
-        "-" * 60,
-        "",
-        f"Primary Goal:",
-        f"  {config.primary_goal}",
-        "",
-        "Secondary Goals:",
-    ]
-
-    for goal in secondary_goals:
-        lines.append(f"  - {goal}")
-
-    lines.extend([
-        "",
-        "-" * 60,
-        "WHAT SUCCESS LOOKS LIKE",
-        "-" * 60,
-        "",
-    ])
-
-    for criterion in success_criteria:
-        lines.append(f"  [_] {criterion}")
-
-    lines.extend([
-        "",
-        "-" * 60,
-        "ITERATION LIMITS",
-        "-" * 60,
-        "",
-        f"  Maximum video attempts:         {pilot.max_attempts}",
-        f"  Max iterations per attempt:     {pilot.max_iterations_per_attempt}",
-        f"  Total possible iterations:      {pilot.max_attempts * pilot.max_iterations_per_attempt}",
-        "",
-        "  If we hit these limits without approval, we will:",
-        "    1. Analyze feedback patterns",
-        "    2. Update our playbook",
-        "    3. Discuss next steps with founder",
-        "",
-        "-" * 60,
-        "FEEDBACK WE WANT FROM THE FOUNDER",
-        "-" * 60,
-        "",
-    ])
-
-    for i, area in enumerate(feedback_areas, 1):
-        lines.append(f"  {i}. {area}")
-
-    lines.extend([
-        "",
-        "  Feedback format:",
-        "    - APPROVE: Ready to publish as-is",
-        "    - MINOR CHANGES: Small tweaks needed (specify what)",
-        "    - MAJOR CHANGES: Significant rework needed (specify issues)",
-        "",
-        "-" * 60,
-        "WHAT WE PROMISE",
-        "-" * 60,
-        "",
-    ])
-
-    for promise in promises:
-        lines.append(f"  [x] {promise}")
-
-    lines.extend([
-        "",
-        "-" * 60,
-        "WHAT WE DON'T PROMISE",
-        "-" * 60,
-        "",
-    ])
-
-    for non_promise in non_promises:
-        lines.append(f"  [ ] {non_promise}")
-
-    lines.extend([
-        "",
-        "-" * 60,
-        "PILOT TIMELINE",
-        "-" * 60,
-        "",
-        "  Day 1:    Initial video generation",
-        "  Day 1-2:  Founder review and feedback",
-        "  Day 2-3:  Iterations based on feedback",
-        "  Day 3-5:  Final approval or decision to stop",
-        "",
-        "  Note: Timeline is approximate and depends on founder availability.",
-        "",
-        "-" * 60,
-        "CONTACT & SUPPORT",
-        "-" * 60,
-        "",
-        "  For questions or issues:",
-        "    - Reply to the email that sent this pilot",
-        "    - Include the Pilot ID in all communications",
-        "",
-        "=" * 60,
-        f"Generated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}",
-        "=" * 60,
-        "",
-    ])
-
-    content = "\n".join(lines)
+        *_DEFAULT_FIXED_PROMISES,
+    )
+    non_promises = config.non_promises or _DEFAULT_NON_PROMISES
+
+    content = _RUNBOOK_TEMPLATE.format(
+        pilot_id=pilot.pilot_id,
+        founder_name=pilot.founder_name,
+        company_name=pilot.company_name,
+        scenario_type=pilot.scenario_type,
+        created=pilot.created_at.strftime('%Y-%m-%d %H:%M UTC'),
+        primary_goal=config.primary_goal,
+        secondary_goals=_bullets(secondary_goals, "- "),
+        success_criteria=_bullets(success_criteria, "[_] "),
+        max_attempts=pilot.max_attempts,
+        max_iterations=pilot.max_iterations_per_attempt,
+        total_iterations=pilot.max_attempts * pilot.max_iterations_per_attempt,
+        feedback_areas="\n".join(
+            f"  {i}. {area}" for i, area in enumerate(feedback_areas, 1)
+        ),
+        promises=_bullets(promises, "[x] "),
+        non_promises=_bullets(non_promises, "[ ] "),
+        generated=datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC'),
+    )
 
     # Write to file if path provided
     if output_path:
-        output_path = Path(output_path)
+        if not isinstance(output_path, Path):
+            output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(content)
+        _write_runbook(output_path, content)
 
     return content
 
@@ -6,6 +6,7 @@ them into reusable playbook entries.
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
@@ -87,18 +88,26 @@ def aggregate_feedback(
     patterns = _detect_patterns(feedback_list, scenario_ids, intent_ids)
     result.patterns = patterns
 
+    # Index existing entries once so each pattern's match is a dict lookup;
+    # setdefault keeps the first entry per key, as a linear scan would
+    similar: dict[tuple[str | None, str | None, str], PlaybookEntry] = {}
+    for existing in playbook.entries:
+        similar.setdefault(_similarity_key(existing), existing)
+
     # Convert patterns to entries
     for pattern in patterns:
         if pattern.occurrences >= min_occurrences:
             entry = _pattern_to_entry(pattern)
             if entry:
                 # Check if similar entry exists
-                existing = _find_similar_entry(playbook, entry)
+                key = _similarity_key(entry)
+                existing = similar.get(key)
                 if existing:
                     _merge_entries(existing, entry)
                     result.entries_updated += 1
                 else:
                     playbook.add_entry(entry)
+                    similar[key] = entry
                     result.entries_created += 1
 
     logger.info(
@@ -112,6 +121,30 @@ def aggregate_feedback(
     return result
 
 
+# FounderFeedback boolean attributes, each reported as the flag of the same name
+_FOUNDER_FLAG_NAMES: tuple[str, ...] = (
+    "too_long",
+    "too_short",
+    "hook_weak",
+    "ending_unclear",
+    "wrong_tone",
+    "missing_key_message",
+)
+
+
+def _new_pattern_bucket() -> dict[str, Any]:
+    """Empty accumulator for one flag in _detect_patterns.
+
+    Every occurrence appends exactly one feedback ID, so the occurrence
+    count is len(feedback_ids) rather than a separate counter.
+    """
+    return {
+        "scenarios": set(),
+        "intents": set(),
+        "feedback_ids": [],
+    }
+
+
 def _detect_patterns(
     feedback_list: list[FounderFeedback | FeedbackAnnotation],
     scenario_ids: list[str | None],
@@ -119,38 +152,32 @@ def _detect_patterns(
 ) -> list[FeedbackPattern]:
     """Detect patterns in feedback."""
     # Track pattern occurrences
-    pattern_data: dict[str, dict[str, Any]] = {}
+    pattern_data: defaultdict[str, dict[str, Any]] = defaultdict(_new_pattern_bucket)
 
     for i, feedback in enumerate(feedback_list):
         scenario_id = scenario_ids[i]
         intent_id = intent_ids[i]
-        feedback_id = f"fb_{i}"
 
         # Extract flags from feedback
         flags = _extract_flags(feedback)
+        if not flags:
+            continue
 
+        feedback_id = f"fb_{i}"
         for flag in flags:
-            if flag not in pattern_data:
-                pattern_data[flag] = {
-                    "occurrences": 0,
-                    "scenarios": set(),
-                    "intents": set(),
-                    "feedback_ids": [],
-                }
-
-            pattern_data[flag]["occurrences"] += 1
+            bucket = pattern_data[flag]
             if scenario_id:
-                pattern_data[flag]["scenarios"].add(scenario_id)
+                bucket["scenarios"].add(scenario_id)
             if intent_id:
-                pattern_data[flag]["intents"].add(intent_id)
-            pattern_data[flag]["feedback_ids"].append(feedback_id)
+                bucket["intents"].add(intent_id)
+            bucket["feedback_ids"].append(feedback_id)
 
     # Convert to FeedbackPattern objects
     patterns = []
     for pattern_type, data in pattern_data.items():
         patterns.append(FeedbackPattern(
             pattern_type=pattern_type,
-            occurrences=data["occurrences"],
+            occurrences=len(data["feedback_ids"]),
             scenarios=list(data["scenarios"]),
             intents=list(data["intents"]),
             feedback_ids=data["feedback_ids"],
@@ -164,28 +191,29 @@ def _detect_patterns(
 
 def _extract_flags(feedback: FounderFeedback | FeedbackAnnotation) -> list[str]:
     """Extract pattern flags from feedback."""
-    flags = []
-
     if isinstance(feedback, FounderFeedback):
-        # Founder feedback has explicit flags
-        if feedback.too_long:
-            flags.append("too_long")
-        if feedback.too_short:
-            flags.append("too_short")
-        if feedback.hook_weak:
-            flags.append("hook_weak")
-        if feedback.ending_unclear:
-            flags.append("ending_unclear")
-        if feedback.wrong_tone:
-            flags.append("wrong_tone")
-        if feedback.missing_key_message:
-            flags.append("missing_key_message")
+        # Founder feedback has explicit flags, in _FOUNDER_FLAG_NAMES order
+        bits = (
+            feedback.too_long,
+            feedback.too_short,
+            feedback.hook_weak,
+            feedback.ending_unclear,
+            feedback.wrong_tone,
+            feedback.missing_key_message,
+        )
+        major = feedback.level == FounderFeedbackLevel.MAJOR_CHANGES
+        if not major and not any(bits):
+            return []
+
+        flags = [name for name, bit in zip(_FOUNDER_FLAG_NAMES, bits) if bit]
 
         # Level as a flag
-        if feedback.level == FounderFeedbackLevel.MAJOR_CHANGES:
+        if major:
             flags.append("major_rework_needed")
+        return flags
 
-    elif isinstance(feedback, FeedbackAnnotation):
+    flags = []
+    if isinstance(feedback, FeedbackAnnotation):
         # Extract from issues
         for issue in feedback.issues:
             if issue.fix_category == FixCategory.PACING:
@@ -214,8 +242,59 @@ def _extract_flags(feedback: FounderFeedback | FeedbackAnnotation) -> list[str]:
     return flags
 
 
+@dataclass(frozen=True, slots=True)
+class _PatternSpec:
+    """Playbook adjustments for one feedback pattern type."""
+
+    description: str
+    pacing_adjustment: float = 0.0
+    trimming_adjustment: float = 0.0
+    hook_strength_adjustment: float = 0.0
+    director_constraints: tuple[str, ...] = ()
+
+
+_PATTERN_SPECS: dict[str, _PatternSpec] = {
+    "too_long": _PatternSpec(
+        description="Content runs too long for platform",
+        trimming_adjustment=0.05,  # Increase trimming by 5%
+        pacing_adjustment=0.1,  # Slightly more aggressive pacing
+        director_constraints=("reduce_shots", "shorter_shots"),
+    ),
+    "too_short": _PatternSpec(
+        description="Content is too brief",
+        trimming_adjustment=-0.05,  # Reduce trimming
+        pacing_adjustment=-0.1,  # Slower pacing
+    ),
+    "hook_weak": _PatternSpec(
+        description="Opening hook needs more impact",
+        hook_strength_adjustment=0.2,  # Stronger hook
+        director_constraints=("stronger_opening", "visual_hook"),
+    ),
+    "ending_unclear": _PatternSpec(
+        description="Ending needs clearer call-to-action",
+        director_constraints=("clear_cta", "decisive_ending"),
+    ),
+    "wrong_tone": _PatternSpec(
+        description="Tone doesn't match brand expectations",
+    ),
+    "missing_key_message": _PatternSpec(
+        description="Key message not coming through clearly",
+    ),
+    "major_rework_needed": _PatternSpec(
+        description="Significant rework frequently needed",
+        trimming_adjustment=0.1,
+        pacing_adjustment=0.15,
+    ),
+}
+
+
 def _pattern_to_entry(pattern: FeedbackPattern) -> PlaybookEntry | None:
     """Convert a pattern to a playbook entry."""
+    spec = _PATTERN_SPECS.get(pattern.pattern_type)
+    if spec is None:
+        # Unknown pattern, skip
+        return None
+
     entry_id = f"entry_{hashlib.sha256(pattern.pattern_type.encode()).hexdigest()[:8]}"
 
     # Determine trigger (specific scenario/intent or general)
@@ -227,82 +306,24 @@ def _pattern_to_entry(pattern: FeedbackPattern) -> PlaybookEntry | None:
     if len(pattern.intents) == 1:
         trigger_intent = pattern.intents[0]
 
-    # Determine adjustments based on pattern type
-    pacing_adjustment = 0.0
-    trimming_adjustment = 0.0
-    hook_strength_adjustment = 0.0
-    director_constraints = []
-    description = ""
-    rationale = ""
-
-    if pattern.pattern_type == "too_long":
-        trimming_adjustment = 0.05  # Increase trimming by 5%
-        pacing_adjustment = 0.1    # Slightly more aggressive pacing
-        director_constraints = ["reduce_shots", "shorter_shots"]
-        description = "Content runs too long for platform"
-        rationale = f"Detected in {pattern.occurrences} feedback instances"
-
-    elif pattern.pattern_type == "too_short":
-        trimming_adjustment = -0.05  # Reduce trimming
-        pacing_adjustment = -0.1    # Slower pacing
-        description = "Content is too brief"
-        rationale = f"Detected in {pattern.occurrences} feedback instances"
-
-    elif pattern.pattern_type == "hook_weak":
-        hook_strength_adjustment = 0.2  # Stronger hook
-        director_constraints = ["stronger_opening", "visual_hook"]
-        description = "Opening hook needs more impact"
-        rationale = f"Detected in {pattern.occurrences} feedback instances"
-
-    elif pattern.pattern_type == "ending_unclear":
-        director_constraints = ["clear_cta", "decisive_ending"]
-        description = "Ending needs clearer call-to-action"
-        rationale = f"Detected in {pattern.occurrences} feedback instances"
-
-    elif pattern.pattern_type == "wrong_tone":
-        description = "Tone doesn't match brand expectations"
-        rationale = f"Detected in {pattern.occurrences} feedback instances"
-
-    elif pattern.pattern_type == "missing_key_message":
-        description = "Key message not coming through clearly"
-        rationale = f"Detected in {pattern.occurrences} feedback instances"
-
-    elif pattern.pattern_type == "major_rework_needed":
-        trimming_adjustment = 0.1
-        pacing_adjustment = 0.15
-        description = "Significant rework frequently needed"
-        rationale = f"Detected in {pattern.occurrences} feedback instances"
-
-    else:
-        # Unknown pattern, skip
-        return None
-
     return PlaybookEntry(
         entry_id=entry_id,
         trigger_scenario=trigger_scenario,
         trigger_intent=trigger_intent,
-        pacing_adjustment=pacing_adjustment,
-        trimming_adjustment=trimming_adjustment,
-        hook_strength_adjustment=hook_strength_adjustment,
-        director_constraints=director_constraints,
+        pacing_adjustment=spec.pacing_adjustment,
+        trimming_adjustment=spec.trimming_adjustment,
+        hook_strength_adjustment=spec.hook_strength_adjustment,
+        director_constraints=list(spec.director_constraints),
         source_feedback_ids=pattern.feedback_ids,
         confidence=pattern.confidence,
-        description=description,
-        rationale=rationale,
+        description=spec.description,
+        rationale=f"Detected in {pattern.occurrences} feedback instances",
     )
 
 
-def _find_similar_entry(playbook: Playbook, new_entry: PlaybookEntry) -> PlaybookEntry | None:
-    """Find an existing entry that's similar to the new one."""
-    for entry in playbook.entries:
-        # Match on trigger conditions and description
-        if (
-            entry.trigger_scenario == new_entry.trigger_scenario
-            and entry.trigger_intent == new_entry.trigger_intent
-            and entry.description == new_entry.description
-        ):
-            return entry
-    return None
+def _similarity_key(entry: PlaybookEntry) -> tuple[str | None, str | None, str]:
+    """Entries are similar if their trigger conditions and description match."""
+    return (entry.trigger_scenario, entry.trigger_intent, entry.description)
 
 
 def _merge_entries(existing: PlaybookEntry, new: PlaybookEntry) -> None:
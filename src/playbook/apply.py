@@ -6,7 +6,7 @@ DirectorConfig, EditorialConfig, and RhythmConfig.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Any
 
 from src.common.logging import get_logger
@@ -114,6 +114,10 @@ def _apply_entry(
     result: PlaybookApplication,
 ) -> tuple[DirectorConfig, EditorialConfig, RhythmConfig]:
     """Apply a single playbook entry."""
+    # Collect field changes per config and rebuild each config at most once
+    director_changes: dict[str, Any] = {}
+    editorial_changes: dict[str, Any] = {}
+    rhythm_changes: dict[str, Any] = {}
 
     # === PACING ADJUSTMENT ===
     if entry.pacing_adjustment != 0.0:
@@ -124,16 +128,8 @@ def _apply_entry(
         new_exit_trim = rhythm.emotion_exit_trim + (entry.pacing_adjustment * 0.1)
 
         # Clamp to valid range
-        new_entry_trim = max(0.05, min(0.35, new_entry_trim))
-        new_exit_trim = max(0.10, min(0.40, new_exit_trim))
-
-        rhythm = RhythmConfig(
-            **{
-                **rhythm.__dict__,
-                "emotion_entry_trim": new_entry_trim,
-                "emotion_exit_trim": new_exit_trim,
-            }
-        )
+        rhythm_changes["emotion_entry_trim"] = max(0.05, min(0.35, new_entry_trim))
+        rhythm_changes["emotion_exit_trim"] = max(0.10, min(0.40, new_exit_trim))
 
     # === TRIMMING ADJUSTMENT ===
     if entry.trimming_adjustment != 0.0:
@@ -141,14 +137,7 @@ def _apply_entry(
 
         # Apply to editorial config
         new_target = editorial.target_reduction_percent + entry.trimming_adjustment
-        new_target = max(0.10, min(0.40, new_target))
-
-        editorial = EditorialConfig(
-            **{
-                **editorial.__dict__,
-                "target_reduction_percent": new_target,
-            }
-        )
+        editorial_changes["target_reduction_percent"] = max(0.10, min(0.40, new_target))
 
     # === HOOK STRENGTH ADJUSTMENT ===
     if entry.hook_strength_adjustment != 0.0:
@@ -158,14 +147,7 @@ def _apply_entry(
         # Stronger hook = longer hook duration
         hook_delta = entry.hook_strength_adjustment * 2.0  # seconds
         new_hook = director.hook_duration + hook_delta
-        new_hook = max(1.0, min(5.0, new_hook))
-
-        director = DirectorConfig(
-            **{
-                **director.__dict__,
-                "hook_duration": new_hook,
-            }
-        )
+        director_changes["hook_duration"] = max(1.0, min(5.0, new_hook))
 
     # === DIRECTOR CONSTRAINTS ===
     if entry.director_constraints:
@@ -177,23 +159,22 @@ def _apply_entry(
     if entry.max_duration_override is not None:
         if result.duration_override is None or entry.max_duration_override < result.duration_override:
             result.duration_override = entry.max_duration_override
-            director = DirectorConfig(
-                **{
-                    **director.__dict__,
-                    "target_duration_seconds": entry.max_duration_override,
-                }
-            )
+            director_changes["target_duration_seconds"] = entry.max_duration_override
 
     # === SHOTS OVERRIDES ===
     if entry.max_shots_override is not None:
         if result.shots_override is None or entry.max_shots_override < result.shots_override:
             result.shots_override = entry.max_shots_override
-            director = DirectorConfig(
-                **{
-                    **director.__dict__,
-                    "max_shots_per_scene": entry.max_shots_override,
-                }
-            )
+            director_changes["max_shots_per_scene"] = entry.max_shots_override
+
+    if rhythm_changes:
+        rhythm = replace(rhythm, **rhythm_changes)
+    if editorial_changes:
+        editorial = replace(editorial, **editorial_changes)
+    if director_changes:
+        # DirectorConfig is a pydantic model; constructing it (rather than
+        # model_copy) keeps field validation and coercion
+        director = DirectorConfig(**{**director.__dict__, **director_changes})
 
     return director, editorial, rhythm
 
@@ -203,16 +184,12 @@ def describe_application(application: PlaybookApplication) -> str:
     if not application.entries_applied:
         return "No playbook entries were applied."
 
-    lines = [
-        f"Applied {len(application.entries_applied)} playbook entries:",
-        "",
-    ]
-
-    for entry in application.entries_applied:
-        lines.append(f"  - {entry.description} (confidence: {entry.confidence:.0%})")
-
-    lines.append("")
-    lines.append("Adjustments:")
+    entries = application.entries_applied
+    lines = [f"Applied {len(entries)} playbook entries:", ""]
+    lines.extend(
+        f"  - {entry.description} (confidence: {entry.confidence:.0%})" for entry in entries
+    )
+    lines.extend(("", "Adjustments:"))
 
     if application.total_pacing_adjustment != 0:
         direction = "faster" if application.total_pacing_adjustment > 0 else "slower"
@@ -2,6 +2,7 @@
 
 import pytest
 import tempfile
+from dataclasses import asdict
 from pathlib import Path
 
 from src.pilot import (
@@ -16,6 +17,7 @@ from src.pilot import (
     assess_system_health,
     determine_recommendation,
     generate_pilot_outcome_report,
+    generate_pilot_outcome_reports,
     Recommendation,
     FounderSatisfactionLevel,
     SystemHealthLevel,
@@ -146,6 +148,83 @@ class TestPilotFeedbackWorkflow:
         assert "What the Founder Would Likely Say" in report
         assert "Detailed Feedback by Attempt" in report
 
+    def test_batch_outcome_reports(self):
+        """Test batch report generation keeps one report per pilot, in order."""
+        pilots = [
+            create_pilot(
+                founder_name=f"Founder {i}",
+                company_name=f"Co{i}",
+                scenario_type="feature_launch",
+            )
+            for i in range(3)
+        ]
+        for pilot in pilots:
+            pilot.add_attempt(video_path="v1.mp4", sla_passed=True)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reports = generate_pilot_outcome_reports(
+                pilots, max_workers=2, output_dir=Path(tmpdir) / "reports",
+            )
+
+            assert len(reports) == 3
+            for pilot, report in zip(pilots, reports):
+                assert f"**Pilot ID:** {pilot.pilot_id}" in report
+                assert (Path(tmpdir) / "reports" / f"{pilot.pilot_id}.md").read_text() == report
+
+    def test_batch_outcome_reports_process_pool(self, monkeypatch):
+        """Test the process pool path produces exactly the serial reports."""
+        from concurrent.futures import ProcessPoolExecutor
+
+        import src.pilot.outcome as outcome
+
+        pools = []
+
+        class RecordingPool(ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                pools.append(kwargs.get("max_workers"))
+                super().__init__(*args, **kwargs)
+
+        monkeypatch.setattr(outcome, "_PARALLEL_REPORTS_MIN_PILOTS", 2)
+        monkeypatch.setattr(outcome, "ProcessPoolExecutor", RecordingPool)
+        monkeypatch.setattr(outcome, "_utc_timestamp", lambda: "2024-01-01 00:00 UTC")
+
+        pilots = [
+            create_pilot(
+                founder_name=f"Founder {i}",
+                company_name=f"Co{i}",
+                scenario_type="feature_launch",
+                brand_context={"tone": "bold"},
+            )
+            for i in range(4)
+        ]
+        for i, pilot in enumerate(pilots):
+            pilot.add_attempt(video_path="v1.mp4", sla_passed=i % 2 == 0)
+            pilot.record_feedback(
+                attempt_number=1,
+                decision=FeedbackDecision.MINOR_CHANGES,
+                flags=["hook_weak"],
+                notes="Tighten the opening.",
+            )
+        pilots[-1].mark_dropped()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            serial = generate_pilot_outcome_reports(
+                pilots, output_dir=Path(tmpdir) / "serial",
+            )
+            assert pools == []
+
+            pooled = generate_pilot_outcome_reports(
+                pilots, max_workers=2, output_dir=Path(tmpdir) / "pooled",
+            )
+            assert pools == [2]
+
+            assert pooled == serial
+            for pilot, report in zip(pilots, pooled):
+                assert "**Generated:** 2024-01-01 00:00 UTC" in report
+                pooled_file = Path(tmpdir) / "pooled" / f"{pilot.pilot_id}.md"
+                serial_file = Path(tmpdir) / "serial" / f"{pilot.pilot_id}.md"
+                assert pooled_file.read_text() == serial_file.read_text() == report
+
     def test_recommendation_with_approve_feedback(self):
         """Test that APPROVE feedback leads to APPROVED_FOR_PUBLISH recommendation."""
         pilot = create_pilot(
@@ -290,6 +369,25 @@ class TestPilotFeedbackWorkflow:
         assert metrics.approve_count == 1
         assert metrics.feedback_received_count == 3
 
+    def test_metrics_for_pilot_without_attempts(self):
+        """Test empty metrics are fresh, mutable and keep list/dict types."""
+        pilot = create_pilot(
+            founder_name="Test",
+            company_name="TestCo",
+            scenario_type="feature_launch",
+        )
+
+        metrics = compute_pilot_metrics(pilot)
+        data = asdict(metrics)
+
+        assert data["feedback_themes"] == []
+        assert data["recurring_flags"] == {}
+        assert compute_pilot_metrics(pilot).feedback_decisions is not metrics.feedback_decisions
+
+        satisfaction = assess_founder_satisfaction(pilot, metrics)
+        assert satisfaction.level == FounderSatisfactionLevel.UNKNOWN
+        assert asdict(satisfaction)["persistent_objections"] == []
+
     def test_metrics_track_recurring_flags(self):
         """Test that metrics track recurring flags correctly."""
         pilot = create_pilot(
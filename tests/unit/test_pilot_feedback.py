@@ -3,6 +3,7 @@
 import pytest
 from datetime import datetime, timezone
 from pathlib import Path
+import os
 import tempfile
 import json
 
@@ -343,3 +344,130 @@ class TestPilotStoreFeedback:
             assert attempt.feedback_notes == "Hook needs work."
             assert attempt.feedback_mode == FeedbackMode.SIMULATED
             assert attempt.feedback_persona == "speed_saas_founder"
+
+    def test_save_with_non_string_brand_context_keys(self):
+        """Test non-string dict keys are stringified, as json.dumps does."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = PilotStore(tmpdir)
+            pilot = create_pilot(
+                founder_name="Test",
+                company_name="TestCo",
+                scenario_type="feature_launch",
+                brand_context={1: "primary", "tone": "bold"},
+            )
+
+            store.save(pilot)
+
+            loaded = store.load(pilot.pilot_id)
+            assert loaded.brand_context == {"1": "primary", "tone": "bold"}
+
+
+class TestPilotStoreIndex:
+    """Test the pilot store index used by list queries."""
+
+    def test_list_queries_use_index(self):
+        """Test filters and newest-first ordering via the index."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = PilotStore(tmpdir)
+
+            first = create_pilot("Ada", "AdaCo", "feature_launch")
+            first.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+            second = create_pilot("Ada", "AdaCo", "problem_solution")
+            second.created_at = datetime(2024, 2, 1, tzinfo=timezone.utc)
+            other = create_pilot("Grace", "GraceCo", "feature_launch")
+            other.mark_dropped()
+            for pilot in (first, second, other):
+                store.save(pilot)
+
+            ada = store.list_pilots(founder_name="ada")
+            assert [p.pilot_id for p in ada] == [second.pilot_id, first.pilot_id]
+            assert store.get_pilot_by_founder("Ada").pilot_id == second.pilot_id
+            assert [p.pilot_id for p in store.get_active_pilots()] == [
+                second.pilot_id,
+                first.pilot_id,
+            ]
+            assert store.list_pilots(status=PilotStatus.COMPLETED)[0].pilot_id == other.pilot_id
+
+    def test_queries_do_not_write(self):
+        """Test list queries leave the storage directory untouched."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pilot = create_pilot("Ada", "AdaCo", "feature_launch")
+            PilotStore(tmpdir).save(pilot)
+            before = {p.name: p.stat().st_mtime_ns for p in Path(tmpdir).iterdir()}
+
+            store = PilotStore(tmpdir)
+            assert store.get_pilot_by_founder("Ada").pilot_id == pilot.pilot_id
+            assert len(store.list_pilots()) == 1
+
+            after = {p.name: p.stat().st_mtime_ns for p in Path(tmpdir).iterdir()}
+            assert after == before
+            assert list(after) == [f"{pilot.pilot_id}.json"]
+
+    def test_same_size_status_change_with_unchanged_mtime(self):
+        """Test a status flip is seen even if size and mtime are unchanged."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = PilotStore(tmpdir)
+            pilot = create_pilot("Ada", "AdaCo", "feature_launch")
+            path = store.save(pilot)
+            assert len(store.get_active_pilots()) == 1
+            stat = path.stat()
+
+            # Another writer flips active -> paused, which keeps the byte
+            # length; pin the old mtime as a coarse-mtime filesystem would
+            path.write_bytes(path.read_bytes().replace(b'"active"', b'"paused"'))
+            assert path.stat().st_size == stat.st_size
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+            assert store.get_active_pilots() == []
+            assert [p.pilot_id for p in store.list_pilots(status=PilotStatus.PAUSED)] == [
+                pilot.pilot_id,
+            ]
+
+    def test_store_sees_pilots_saved_by_another_store(self):
+        """Test a store picks up pilots another store saved after it was used."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first_store = PilotStore(tmpdir)
+            second_store = PilotStore(tmpdir)
+            assert first_store.list_pilots() == []
+
+            pilot = create_pilot("Ada", "AdaCo", "feature_launch")
+            second_store.save(pilot)
+
+            assert [p.pilot_id for p in first_store.list_pilots()] == [pilot.pilot_id]
+
+    def test_stale_store_does_not_hide_status_changes(self):
+        """Test an index rewritten by a stale store is corrected from the files."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            stale_store = PilotStore(tmpdir)
+            pilot = create_pilot("Ada", "AdaCo", "feature_launch")
+            stale_store.save(pilot)
+            assert len(stale_store.get_active_pilots()) == 1
+
+            # Another store completes the pilot...
+            other_store = PilotStore(tmpdir)
+            updated = other_store.load(pilot.pilot_id)
+            updated.mark_approved()
+            updated.notes = "approved elsewhere"
+            other_store.save(updated)
+
+            # ...then the stale store rewrites the index for a new pilot
+            stale_store.save(create_pilot("Grace", "GraceCo", "feature_launch"))
+
+            completed = PilotStore(tmpdir).list_pilots(status=PilotStatus.COMPLETED)
+            assert [p.pilot_id for p in completed] == [pilot.pilot_id]
+            assert [p.founder_name for p in stale_store.get_active_pilots()] == ["Grace"]
+
+    def test_concurrent_saves_leave_valid_files(self):
+        """Test concurrent saves of one pilot never mix temp files."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pilot = create_pilot("Ada", "AdaCo", "feature_launch")
+            stores = [PilotStore(tmpdir) for _ in range(8)]
+
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(lambda store: store.save(pilot), stores * 4))
+
+            assert list(Path(tmpdir).glob("*.tmp")) == []
+            assert PilotStore(tmpdir).load(pilot.pilot_id).pilot_id == pilot.pilot_id
+            assert [p.pilot_id for p in PilotStore(tmpdir).list_pilots()] == [pilot.pilot_id]
@@ -0,0 +1,50 @@
+"""Unit tests for playbook feedback aggregation."""
+
+from src.founder import FounderFeedback, FounderFeedbackLevel
+from src.playbook.aggregation import _extract_flags, aggregate_feedback
+from src.playbook.playbook import Playbook
+
+
+class TestExtractFlags:
+    """Tests for _extract_flags."""
+
+    def test_founder_feedback_flags(self):
+        """Test founder callouts and major changes become flags in order."""
+        feedback = FounderFeedback(
+            level=FounderFeedbackLevel.MAJOR_CHANGES,
+            too_long=True,
+            wrong_tone=True,
+        )
+
+        assert _extract_flags(feedback) == ["too_long", "wrong_tone", "major_rework_needed"]
+
+    def test_founder_feedback_without_flags(self):
+        """Test approving feedback with no callouts yields no flags."""
+        feedback = FounderFeedback(level=FounderFeedbackLevel.APPROVE)
+
+        assert _extract_flags(feedback) == []
+
+
+class TestAggregateFeedback:
+    """Tests for aggregate_feedback."""
+
+    def test_repeated_flags_create_entries(self):
+        """Test flags seen min_occurrences times become playbook entries."""
+        playbook = Playbook(playbook_id="pb_test", name="Test")
+        feedback = [
+            FounderFeedback(level=FounderFeedbackLevel.MINOR_CHANGES, too_long=True),
+            FounderFeedback(level=FounderFeedbackLevel.MINOR_CHANGES, too_long=True),
+            FounderFeedback(level=FounderFeedbackLevel.MINOR_CHANGES, hook_weak=True),
+        ]
+
+        result = aggregate_feedback(playbook, feedback, scenario_ids=["s1", "s1", "s2"])
+
+        assert [p.pattern_type for p in result.patterns] == ["too_long", "hook_weak"]
+        assert result.entries_created == 1
+        assert playbook.entries[0].trigger_scenario == "s1"
+        assert playbook.entries[0].source_feedback_ids == ["fb_0", "fb_1"]
+
+        # The same feedback again merges into the existing entry
+        again = aggregate_feedback(playbook, feedback, scenario_ids=["s1", "s1", "s2"])
+        assert again.entries_updated == 1
+        assert len(playbook.entries) == 1
@@ -1,7 +1,10 @@
 """Unit tests for IterativeRefinementController."""
 
+import asyncio
+import sys
 import pytest
 from datetime import datetime
+from types import SimpleNamespace
 
 from src.orchestration.refinement import (
     IterativeRefinementController,
@@ -11,6 +14,7 @@ from src.orchestration.refinement import (
     RefinementStatus,
     default_fix_function,
     run_refinement_loop,
+    uvloop_loop_factory,
 )
 from src.orchestration.feedback_consumer import (
     FeedbackConsumer,
@@ -26,8 +30,10 @@ from src.common.models import (
     FeedbackTargetType,
     FeedbackSource,
 )
+from src.agents import CriticOutput
 from src.knowledge_graph.scene_graph import SceneGraph
 from src.common.models import Story, Scene, SceneSetting, EmotionalBeat
+from src.common.models import SourceMetadata, SourceType
 
 
 @pytest.fixture
@@ -157,6 +163,14 @@ class TestIterativeRefinementController:
 
         assert controller.config.max_iterations == 3
 
+    def test_cancel_sets_flag(self):
+        """Test cancel() marks the controller as cancelled."""
+        controller = IterativeRefinementController()
+
+        assert controller.cancelled is False
+        controller.cancel()
+        assert controller.cancelled is True
+
     @pytest.mark.asyncio
     async def test_run_returns_result(self, sample_scene_graph):
         """Test run returns SceneGraph and RefinementResult."""
@@ -258,6 +272,138 @@ class TestIterativeRefinementController:
         assert prioritized[0].category == FixCategory.HOOK
 
 
+class _BlockingCritic:
+    """Critic stand-in that never returns until it is cancelled."""
+
+    def __init__(self):
+        self.started = asyncio.Event()
+        self.cancelled = False
+
+    async def __call__(self, critic_input):
+        self.started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+@pytest.fixture
+def minimal_scene_graph():
+    """Create a SceneGraph with a valid Story and no scenes."""
+    story = Story(
+        title="Test Story",
+        source_type=SourceType.NARRATIVE,
+        source_metadata=SourceMetadata(title="Test Story"),
+    )
+    return SceneGraph(story=story)
+
+
+class TestRefinementCancellation:
+    """Tests for cancelling IterativeRefinementController.run."""
+
+    @pytest.mark.asyncio
+    async def test_cancel_before_run_aborts(self, minimal_scene_graph):
+        """Test a cancelled controller aborts without calling the critic."""
+        critic = _BlockingCritic()
+        controller = IterativeRefinementController(critic=critic)
+        controller.cancel()
+
+        _, result = await controller.run(minimal_scene_graph)
+
+        assert result.status == RefinementStatus.ABORTED
+        assert result.stop_reason == "cancelled"
+        assert result.iterations_completed == 0
+        assert not critic.started.is_set()
+
+    @pytest.mark.asyncio
+    async def test_cancel_mid_critic_aborts(self, minimal_scene_graph):
+        """Test cancel() during a critic call aborts and stops the critic."""
+        critic = _BlockingCritic()
+        controller = IterativeRefinementController(critic=critic)
+
+        run_task = asyncio.create_task(controller.run(minimal_scene_graph))
+        await asyncio.wait_for(critic.started.wait(), timeout=1)
+        controller.cancel()
+        graph, result = await asyncio.wait_for(run_task, timeout=1)
+
+        assert graph is minimal_scene_graph
+        assert result.status == RefinementStatus.ABORTED
+        assert result.stop_reason == "cancelled"
+        assert result.iterations_completed == 0
+        assert critic.cancelled
+
+    @pytest.mark.asyncio
+    async def test_caller_cancellation_stops_critic(self, minimal_scene_graph):
+        """Test cancelling the run task also cancels the in-flight critic."""
+        critic = _BlockingCritic()
+        controller = IterativeRefinementController(critic=critic)
+
+        run_task = asyncio.create_task(controller.run(minimal_scene_graph))
+        await asyncio.wait_for(critic.started.wait(), timeout=1)
+        run_task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await run_task
+        assert critic.cancelled
+
+
+class TestRefinementBudget:
+    """Tests for the pre-iteration budget guard."""
+
+    @pytest.mark.asyncio
+    async def test_zero_budget_runs_no_iteration(self, minimal_scene_graph):
+        """Test a zero budget stops before any paid critic call."""
+        critic = _BlockingCritic()
+        controller = IterativeRefinementController(
+            config=RefinementConfig(max_cost_dollars=0.0),
+            critic=critic,
+        )
+
+        _, result = await asyncio.wait_for(controller.run(minimal_scene_graph), timeout=1)
+
+        assert result.status == RefinementStatus.BUDGET_EXCEEDED
+        assert result.stop_reason.startswith("budget_exceeded")
+        assert result.iterations_completed == 0
+        assert result.total_cost == 0.0
+        assert not critic.started.is_set()
+
+    @pytest.mark.asyncio
+    async def test_budget_reached_after_iteration(self, minimal_scene_graph):
+        """Test the budget cap stops the loop once an iteration uses it up."""
+        calls = []
+
+        async def critic(critic_input):
+            calls.append(critic_input)
+            return CriticOutput(
+                story_feedback=FeedbackAnnotation(
+                    target_type=FeedbackTargetType.STORY,
+                    target_id=critic_input.scene_graph.story.id,
+                    source=FeedbackSource.AI_CRITIC,
+                    overall_score=4.0,
+                    recommendation=FeedbackRecommendation.MAJOR_REVISION,
+                ),
+            )
+
+        controller = IterativeRefinementController(
+            config=RefinementConfig(
+                max_iterations=5,
+                max_cost_dollars=0.05,
+                cost_per_critique=0.05,
+                stop_on_minor_fixes=False,
+                stop_on_no_improvement=False,
+            ),
+            critic=critic,
+        )
+
+        _, result = await controller.run(minimal_scene_graph)
+
+        assert len(calls) == 1
+        assert result.iterations_completed == 1
+        assert result.status == RefinementStatus.BUDGET_EXCEEDED
+        assert result.stop_reason == "budget_exceeded: $0.05 >= $0.05"
+
+
 class TestDefaultFixFunction:
     """Tests for default_fix_function."""
 
@@ -275,6 +421,38 @@ class TestDefaultFixFunction:
         assert result.story.id == sample_scene_graph.story.id
 
 
+class TestUvloopLoopFactory:
+    """Tests for uvloop_loop_factory."""
+
+    def test_none_without_uvloop(self, monkeypatch):
+        """Test no factory is offered when uvloop is not installed."""
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+
+        assert uvloop_loop_factory() is None
+
+    def test_factory_leaves_policy_alone(self, monkeypatch):
+        """Test the factory drives asyncio.Runner without a global policy."""
+        created = []
+
+        def new_event_loop():
+            loop = asyncio.new_event_loop()
+            created.append(loop)
+            return loop
+
+        monkeypatch.setitem(sys.modules, "uvloop", SimpleNamespace(new_event_loop=new_event_loop))
+        policy = asyncio.get_event_loop_policy()
+
+        loop_factory = uvloop_loop_factory()
+        assert loop_factory is new_event_loop
+
+        async def running_loop():
+            return asyncio.get_running_loop()
+
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            assert runner.run(running_loop()) is created[0]
+        assert asyncio.get_event_loop_policy() is policy
+
+
 class TestRunRefinementLoop:
     """Tests for run_refinement_loop convenience function."""
 